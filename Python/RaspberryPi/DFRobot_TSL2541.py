@@ -9,179 +9,361 @@
   @get from https://www.dfrobot.com
   @url https://github.com/DFRobot/DFRobot_TSL2541
 """
-import sys
-sys.path.append('../')
-import smbus
+import errno
+import json
+import os
+import threading
 import time
+from contextlib import contextmanager
+
+# Callable opening an I2C bus by number, resolved on first use so the module imports without I2C support
+_bus_backend = None
+
+'''
+    @brief  Choose how DFRobot_TSL2541(bus=<number>) opens the I2C bus
+    @param  factory  callable taking the bus number and returning an SMBus-compatible object, e.g. smbus2.SMBus;
+    @n               None to go back to the automatic choice (smbus2, then smbus)
+'''
+def set_bus_backend(factory):
+    global _bus_backend
+    _bus_backend = factory
+
+def get_bus_backend():
+    global _bus_backend
+    if _bus_backend is None:
+        try:
+            import smbus2 as module
+        except ImportError:
+            try:
+                import smbus as module
+            except ImportError:
+                raise ImportError('no I2C backend found, install smbus2 or smbus, or pass an SMBus-compatible bus object')
+        _bus_backend = module.SMBus
+    return _bus_backend
+
+'''
+ * Enable Register (ENABLE 0x80)
+ * ------------------------------------------------------------------------------------------
+ * |    b7    |    b6    |    b5    |    b4    |    b3    |    b2    |    b1     |    b0    |
+ * ------------------------------------------------------------------------------------------
+ * |                  reversed                 |   WEN    | reserved |    AEN    |   PON    |
+ * ------------------------------------------------------------------------------------------
+ *
+'''
+
+'''
+ * CFG0 Register (0x8D)
+ * ------------------------------------------------------------------------------------------------
+ * |    b7       |       b6    |    b5    |    b4    |    b3    |    b2    |    b1     |    b0    |
+ * ------------------------------------------------------------------------------------------------
+ * | reversed<1> |                  reversed                    |   WLONG  |       reversed       |
+ * ------------------------------------------------------------------------------------------------
+ * Reserved: Write as 0.
+ * Reserved<1>: Write as 1.
+ * Wait Long: When asserted, the wait cycles are increased by a factor 12× from that programmed in the WTIME register.
+'''
+
+'''
+ * CFG1 Register (0x90) 
+ * ---------------------------------------------------------------------------------------------
+ * |    b7    |       b6    |    b5    |    b4    |    b3    |    b2    |    b1     |    b0    |
+ * ---------------------------------------------------------------------------------------------
+ * |                               reversed                             |         AGAIN        |
+ * ---------------------------------------------------------------------------------------------
+ * Reserved: Write as 0.
+ * AMUX:ALS Multiplexer. Sets the CH3 input. Default = 0 (X Channel). Set to 1 to read IR2.
+ * AGAIN: ALS Gain Control. Sets the gain of the ALS DAC.
+ * ----------------------------------------------------------
+ * | Field Value |            ALS GAIN VALUE                |
+ * ----------------------------------------------------------
+ * |     00      |               1X Gain                    |
+ * ----------------------------------------------------------
+ * |     01      |               4X Gain                    |
+ * ----------------------------------------------------------
+ * |     10      |               16X Gain                   |
+ * ----------------------------------------------------------
+ * |     11      |               64X Gain                   |
+ * ----------------------------------------------------------
+'''
+
+'''
+ * Status Register (STATUS 0x93)
+ * ------------------------------------------------------------------------------------------
+ * |    b7    |    b6    |    b5    |    b4    |    b3    |    b2    |    b1     |    b0    |
+ * ------------------------------------------------------------------------------------------
+ * |   ASAT   |       Reserved      |    AINT  |   CINT   |       Reserved                  |
+ * ------------------------------------------------------------------------------------------
+ * ASAT: ALS Saturation. This flag is set for analog saturation, writing a 1 will clear this status flag.
+ * Reserved:Reserved.
+ * AINT:ALS Interrupt. Indicates that the device is asserting an ALS interrupt, writing a 1 will clear this status flag.
+ * CINT:The Calibration Interrupt flag indicates that calibration has completed.
+'''
+
+'''
+ * CFG2 Register (0x9F)
+ * ---------------------------------------------------------------------------------------------
+ * |    b7    |       b6    |    b5    |    b4    |    b3    |    b2    |    b1     |    b0    |
+ * ---------------------------------------------------------------------------------------------
+ * |           Reserved(000)           | AGAINMAX | Reserved |  AGAINL  |     Reserved(00)     |
+ * ---------------------------------------------------------------------------------------------
+ * The ALS gain can be adjusted by setting the two AGAIN bits as well as the AGAINMAX and AGAINL bits 
+ * which yields an overall range from 1/2x to 128x.
+'''
+
+'''
+ * CFG3 Register (0xAB)
+ * ----------------------------------------------------------------------------------------------------
+ * |        b7          |    b6    |    b5    |    b4    |    b3    |    b2    |    b1     |    b0    |
+ * ----------------------------------------------------------------------------------------------------
+ * |   INT_READ_CLEAR   |     Reserved(0)     |    SAI   |           Reserved(any value)              |
+ * ----------------------------------------------------------------------------------------------------
+ * INT_READ_CLEAR:If this bit is set, all flag bits in the STATUS register will be reset whenever the STATUS register is read over I2C.
+ * SAI:Sleep After Interrupt. Power down the device at the end of the ALS cycle if an interrupt has been generated.
+'''
+
+'''
+ * AZ_CONFIG Register (0xD6)
+ * ---------------------------------------------------------------------------------------------
+ * |     b7    |       b6    |    b5    |    b4    |    b3    |    b2    |    b1     |    b0   |
+ * ---------------------------------------------------------------------------------------------
+ * |  AZ_MODE  |                                 AZ_NTH_ITERATION                              |
+ * ---------------------------------------------------------------------------------------------
+ * AZ_MODE: 0, Always start at zero when searching the best offset value
+ *          1, Always start at the previous (offset_c) with the auto-zero mechanism
+ * AZ_NTH_ITERATION : Run autozero automatically every nth ALS iteration
+ *                    (0=never, 7Fh=only at first ALS cycle, n=every nth time)
+'''
+
+'''
+ * STATUS2 Register (0xA3)
+ * ------------------------------------------------------------------------------------------
+ * |    b7    |    b6    |    b5    |    b4    |    b3    |    b2    |    b1     |    b0    |
+ * ------------------------------------------------------------------------------------------
+ * | Reserved |  AVALID  | Reserved | ASAT_DIG | ASAT_ANA |            Reserved             |
+ * ------------------------------------------------------------------------------------------
+ * AVALID: ALS Valid. Indicates that an ALS cycle has completed since AEN was asserted.
+ * ASAT_DIG: ALS Digital Saturation. The ALS count has reached the maximum for the integration time.
+ * ASAT_ANA: ALS Analog Saturation. The intensity exceeded the analog range of the photodiode.
+'''
+
+'''
+ * INTENAB Register (0xDD)
+ * ------------------------------------------------------------------------------------------
+ * |    b7    |    b6    |    b5    |    b4    |    b3    |    b2    |    b1     |    b0    |
+ * ------------------------------------------------------------------------------------------
+ * |  ASIEN   |     Reserved(0)     |   AIEN   |                 Reserved(0)                |
+ * ------------------------------------------------------------------------------------------
+ * ASIEN: Writing '1' to this bit enables ASAT interrupt.
+ * AIEN: Writing '1' to this bit enables ALS interrupt.
+'''
+
+# Register map: name, address, power-on value, mirrored in the write-through shadow cache
+REGISTERS = (
+    ('ENABLE',    0x80, 0x00, True),
+    ('ATIME',     0x81, 0x00, False),
+    ('WTIME',     0x83, 0x00, False),
+    ('AILTL',     0x84, 0x00, False),
+    ('AILTH',     0x85, 0x00, False),
+    ('AIHTL',     0x86, 0x00, False),
+    ('AIHTH',     0x87, 0x00, False),
+    ('PERS',      0x8C, 0x00, True),
+    ('CFG0',      0x8D, 0x80, True),
+    ('CFG1',      0x90, 0x00, True),
+    ('REVID',     0x91, 0x61, False),
+    ('ID',        0x92, 0xE4, False),
+    ('STATUS',    0x93, 0x00, False),
+    ('VISDATAL',  0x94, 0x00, False),
+    ('VISDATAH',  0x95, 0x00, False),
+    ('IRDATAL',   0x96, 0x00, False),
+    ('IRDATAH',   0x97, 0x00, False),
+    ('REVID2',    0x9E, 0x00, False),
+    ('CFG2',      0x9F, 0x04, True),
+    ('STATUS2',   0xA3, 0x00, False),
+    ('CFG3',      0xAB, 0x0C, True),
+    ('AZ_CONFIG', 0xD6, 0x7F, True),
+    ('INTENAB',   0xDD, 0x00, True),
+    ('VISADJ',    0xE6, 0x00, False),
+)
+
+class DFRobot_TSL2541_FaultError(IOError):
+    '''
+        @brief  Raised instead of touching the bus while a circuit breaker has the sensor marked faulty
+    '''
+    pass
+
+class _StreamPacer(object):
+    '''
+        @brief  Read schedule of stream(), shared by the blocking and the asyncio loops
+        @n      The first read of each result waits for the next cycle, further reads poll every period/8
+        @n      until a new result shows up. A result found by polling arrived just now, so the schedule is
+        @n      re-anchored on it, as it is when the reader falls more than a period behind.
+    '''
+    def __init__(self, period):
+        self.period = period
+        self._deadline = None
+        self._polled = False
+
+    '''
+        @brief  Seconds to wait before the first read of the next result
+    '''
+    def delay(self, now):
+        self._polled = False
+        if self._deadline is None:
+            return 0
+        return max(self._deadline - now, 0)
+
+    '''
+        @brief  Seconds to wait before reading again, the last read had no new result
+    '''
+    def poll(self):
+        self._polled = True
+        return self.period / 8
+
+    '''
+        @brief  Record that a new result was read at `now`
+    '''
+    def found(self, now):
+        if self._deadline is None or self._polled or now - self._deadline > self.period:
+            self._deadline = now + self.period
+        else:
+            # the result may have waited since before the read, come back a little early so a device
+            # oscillator faster than nominal is tracked instead of losing a result every few cycles
+            self._deadline = self._deadline + self.period * 15 / 16
 
 class DFRobot_TSL2541:
     DFRobot_TSL2541_IIC_ADDR           = 0x39
     
-    '''
-     * Enable Register (ENABLE 0x80)
-     * ------------------------------------------------------------------------------------------
-     * |    b7    |    b6    |    b5    |    b4    |    b3    |    b2    |    b1     |    b0    |
-     * ------------------------------------------------------------------------------------------
-     * |                  reversed                 |   WEN    | reserved |    AEN    |   PON    |
-     * ------------------------------------------------------------------------------------------
-     *
-    '''
-    TSL2541_REG_ENABLE                 = 0x80
-    TSL2541_REG_ATIME                  = 0x81
-    TSL2541_REG_WTIME                  = 0x83
-    TSL2541_REG_AILTL                  = 0x84
-    TSL2541_REG_AILTH                  = 0x85
-    TSL2541_REG_AIHTL                  = 0x86
-    TSL2541_REG_AIHTH                  = 0x87
-    TSL2541_REG_PERS                   = 0x8C
-    '''
-     * CFG0 Register (0x8D)
-     * ------------------------------------------------------------------------------------------------
-     * |    b7       |       b6    |    b5    |    b4    |    b3    |    b2    |    b1     |    b0    |
-     * ------------------------------------------------------------------------------------------------
-     * | reversed<1> |                  reversed                    |   WLONG  |       reversed       |
-     * ------------------------------------------------------------------------------------------------
-     * Reserved: Write as 0.
-     * Reserved<1>: Write as 1.
-     * Wait Long: When asserted, the wait cycles are increased by a factor 12× from that programmed in the WTIME register.
-    '''
-    TSL2541_REG_CFG0                   = 0x8D
-    '''
-     * CFG1 Register (0x90) 
-     * ---------------------------------------------------------------------------------------------
-     * |    b7    |       b6    |    b5    |    b4    |    b3    |    b2    |    b1     |    b0    |
-     * ---------------------------------------------------------------------------------------------
-     * |                               reversed                             |         AGAIN        |
-     * ---------------------------------------------------------------------------------------------
-     * Reserved: Write as 0.
-     * AMUX:ALS Multiplexer. Sets the CH3 input. Default = 0 (X Channel). Set to 1 to read IR2.
-     * AGAIN: ALS Gain Control. Sets the gain of the ALS DAC.
-     * ----------------------------------------------------------
-     * | Field Value |            ALS GAIN VALUE                |
-     * ----------------------------------------------------------
-     * |     00      |               1X Gain                    |
-     * ----------------------------------------------------------
-     * |     01      |               4X Gain                    |
-     * ----------------------------------------------------------
-     * |     10      |               16X Gain                   |
-     * ----------------------------------------------------------
-     * |     11      |               64X Gain                   |
-     * ----------------------------------------------------------
-    '''
-    TSL2541_REG_CFG1                   = 0x90
-    
-    TSL2541_REG_REVID                  = 0x91
-    TSL2541_REG_ID                     = 0x92
-    '''
-     * Status Register (STATUS 0x93)
-     * ------------------------------------------------------------------------------------------
-     * |    b7    |    b6    |    b5    |    b4    |    b3    |    b2    |    b1     |    b0    |
-     * ------------------------------------------------------------------------------------------
-     * |   ASAT   |       Reserved      |    AINT  |   CINT   |       Reserved                  |
-     * ------------------------------------------------------------------------------------------
-     * ASAT: ALS Saturation. This flag is set for analog saturation, writing a 1 will clear this status flag.
-     * Reserved:Reserved.
-     * AINT:ALS Interrupt. Indicates that the device is asserting an ALS interrupt, writing a 1 will clear this status flag.
-     * CINT:The Calibration Interrupt flag indicates that calibration has completed.
-    '''
-    TSL2541_REG_STATUS                 = 0x93
-    TSL2541_REG_VISDATAL               = 0x94
-    TSL2541_REG_VISDATAH               = 0x95
-    TSL2541_REG_IRDATAL                = 0x96
-    TSL2541_REG_IRDATAH                = 0x97
-    TSL2541_REG_REVID2                 = 0x9E
-    '''
-     * CFG2 Register (0x9F)
-     * ---------------------------------------------------------------------------------------------
-     * |    b7    |       b6    |    b5    |    b4    |    b3    |    b2    |    b1     |    b0    |
-     * ---------------------------------------------------------------------------------------------
-     * |           Reserved(000)           | AGAINMAX | Reserved |  AGAINL  |     Reserved(00)     |
-     * ---------------------------------------------------------------------------------------------
-     * The ALS gain can be adjusted by setting the two AGAIN bits as well as the AGAINMAX and AGAINL bits 
-     * which yields an overall range from 1/2x to 128x.
-    '''
-    TSL2541_REG_CFG2                   = 0x9F
-    '''
-     * CFG3 Register (0xAB)
-     * ----------------------------------------------------------------------------------------------------
-     * |        b7          |    b6    |    b5    |    b4    |    b3    |    b2    |    b1     |    b0    |
-     * ----------------------------------------------------------------------------------------------------
-     * |   INT_READ_CLEAR   |     Reserved(0)     |    SAI   |           Reserved(any value)              |
-     * ----------------------------------------------------------------------------------------------------
-     * INT_READ_CLEAR:If this bit is set, all flag bits in the STATUS register will be reset whenever the STATUS register is read over I2C.
-     * SAI:Sleep After Interrupt. Power down the device at the end of the ALS cycle if an interrupt has been generated.
-    '''
-    TSL2541_REG_CFG3                   = 0xAB
-    '''
-     * AZ_CONFIG Register (0xD6)
-     * ---------------------------------------------------------------------------------------------
-     * |     b7    |       b6    |    b5    |    b4    |    b3    |    b2    |    b1     |    b0   |
-     * ---------------------------------------------------------------------------------------------
-     * |  AZ_MODE  |                                 AZ_NTH_ITERATION                              |
-     * ---------------------------------------------------------------------------------------------
-     * AZ_MODE: 0, Always start at zero when searching the best offset value
-     *          1, Always start at the previous (offset_c) with the auto-zero mechanism
-     * AZ_NTH_ITERATION : Run autozero automatically every nth ALS iteration
-     *                    (0=never, 7Fh=only at first ALS cycle, n=every nth time)
-    '''
-    TSL2541_REG_AZ_CONFIG              = 0xD6
-    
-    '''
-     * INTENAB Register (0xDD)
-     * ------------------------------------------------------------------------------------------
-     * |    b7    |    b6    |    b5    |    b4    |    b3    |    b2    |    b1     |    b0    |
-     * ------------------------------------------------------------------------------------------
-     * |  ASIEN   |     Reserved(0)     |   AIEN   |                 Reserved(0)                |
-     * ------------------------------------------------------------------------------------------
-     * ASIEN: Writing '1' to this bit enables A
-     
-     
-     
-     
-     SAT interrupt.
-     * AIEN: Writing '1' to this bit enables ALS interrupt.
-    '''
-    TSL2541_REG_INTENAB                = 0xDD
-    TSL2541_REG_VISADJ                 = 0xE6
-    
     DEVICE_ID                          = 0xE4
     REVISION_ID                        = 0x61
     CONFIG_NO_WLONG                    = 0x80
     CONFIG_WLONG                       = 0x84
+    STATUS_ASAT                        = 0x80
+    STATUS_AINT                        = 0x10
+    STATUS2_AVALID                     = 0x40
+    # Duration of one integration or wait step, in seconds
+    CYCLE_STEP                         = 0.00278
+    
+    # Configuration registers mirrored in the write-through shadow cache
+    SHADOW_REGS                        = frozenset(reg[1] for reg in REGISTERS if reg[3])
+    # Registers that make up the configuration image used by begin(warm=True)
+    CONFIG_REGS                        = tuple(reg[1] for reg in REGISTERS if reg[0] in ('ENABLE', 'ATIME', 'WTIME',
+                                               'AILTL', 'AILTH', 'AIHTL', 'AIHTH', 'PERS', 'CFG0', 'CFG1', 'CFG2',
+                                               'CFG3', 'AZ_CONFIG', 'INTENAB'))
     
     ''' 
         @brief  Module init
-        @param  bus  Set to IICBus
-    '''
-    def __init__(self,bus = 1):
-        self.i2cbus=smbus.SMBus(bus)
+        @param  bus      Set to IICBus, or an SMBus-compatible object (a shared handle, DFRobot_TSL2541_Emulator...)
+        @param  backend  callable opening the bus by number, defaults to get_bus_backend()
+    '''
+    def __init__(self,bus = 1,backend = None):
+        if isinstance(bus, int):
+            self.i2cbus=(backend or get_bus_backend())(bus)
+        else:
+            self.i2cbus=bus
         self.i2c_addr = self.DFRobot_TSL2541_IIC_ADDR
+        # serializes register access and transactions between threads sharing the sensor
+        self._lock = threading.RLock()
+        self._shadow = {}
+        self._batch = None
+        self._atime = 0
+        self._wtime = 0
+        self._gain = 1
+        self._wlong = 0
+        self._metrics = None
+        self._retries = 0
+        self._backoff = 0
+        self._max_backoff = 0
+        self._breaker = None
+        self._trace = None
+        self._plain_io = True
     
     ''' 
         @brief  Initialize the device and turn it on
+        @n      With warm=True the configuration is read back first (ENABLE..ID in one block read plus CFG2,
+        @n      CFG3, AZ_CONFIG and INTENAB) and only the registers that differ from `image` are written, so a
+        @n      running device keeps its integration cycle. Without an image a device that is already on is
+        @n      adopted as it is. A device that lost its configuration gets the full initialization.
+        @param  warm   try the warm-restart path first
+        @param  image  wanted configuration, a dict of register -> value from config_image() or the path of
+        @n             a file written by save_config_image(); a missing file counts as no image
         @return  Whether the device is on or not. True succeed, False failed 
     '''
-    def begin(self):
-        self._soft_reset()
-        self._set_power_als_on()
-        device_id = self._get_device_id()
-        revision_id =self._get_revision_id()
+    def begin(self, warm = False, image = None):
+        if warm:
+            try:
+                if self._warm_begin(image):
+                    return True
+            except IOError:
+                return False
+        try:
+            self._soft_reset()
+            self._set_power_als_on()
+            device_id = self._get_device_id()
+            revision_id =self._get_revision_id()
+        except IOError:
+            return False
         if device_id != self.DEVICE_ID and revision_id != self.REVISION_ID :
             self._set_device_adc(False)
             self._set_device_power(False)
             return False
         return True 
     
+    ''' 
+        @brief  Read the configuration registers from the device
+        @return  dict of register -> value for every register in CONFIG_REGS
+    '''
+    def config_image(self):
+        current = self._read_config_image()
+        return dict((reg, current[reg]) for reg in self.CONFIG_REGS)
+    
+    ''' 
+        @brief  Store the device configuration as the image for a later begin(warm=True, image=path)
+        @param  path  JSON file to write
+    '''
+    def save_config_image(self, path):
+        image = self.config_image()
+        with open(path, 'w') as f:
+            json.dump(dict(('0x%02X' % reg, image[reg]) for reg in image), f, indent = 2, sort_keys = True)
+    
+    ''' 
+        @brief  Write a configuration image with one block write per contiguous register range
+        @n      Shadowed registers that already hold the wanted value are skipped. With verify each written
+        @n      range is read back with one block read.
+        @param  image   dict of register -> value, e.g. from config_image() or DFRobot_TSL2541_Profiles
+        @param  verify  read the written ranges back and compare
+        @return  number of registers written
+        @exception IOError  errno.EIO if a register reads back a different value
+    '''
+    def write_config_image(self, image, verify = True):
+        image = self._load_config_image(image)
+        with self._lock:
+            pending = {}
+            for reg in self.CONFIG_REGS:
+                if reg in image and (reg not in self.SHADOW_REGS or self._shadow.get(reg) != image[reg]):
+                    pending[reg] = image[reg]
+            with self.transaction():
+                for reg in pending:
+                    self._write_reg(reg, pending[reg])
+            if verify:
+                for regs in self._ranges(pending):
+                    buf = self._read_block(regs[0], len(regs))
+                    for i in range(len(regs)):
+                        if buf[i] != pending[regs[i]]:
+                            self.invalidate_shadow()
+                            raise IOError(errno.EIO, 'register 0x%02X reads 0x%02X after writing 0x%02X' % (regs[i], buf[i], pending[regs[i]]))
+            self._adopt_config_image(image)
+            return len(pending)
+    
     ''' 
         @brief  Config the wait timer 
         @param  mode  set wait-timer,True enable False disenable
     '''
     def set_wait_timer(self,mode=True):
         if mode==True:
-            buf = self._read_reg(self.TSL2541_REG_ENABLE)|0x02
+            buf = self._read_shadow_reg(self.TSL2541_REG_ENABLE)|0x08
             self._write_reg(self.TSL2541_REG_ENABLE, buf)
         if mode==False:
-            buf = self._read_reg(self.TSL2541_REG_ENABLE)&0xFE
+            buf = self._read_shadow_reg(self.TSL2541_REG_ENABLE)&0xF7
             self._write_reg(self.TSL2541_REG_ENABLE, buf)
     
     ''' 
@@ -190,8 +372,15 @@ class DFRobot_TSL2541:
     '''
     def set_integration_time(self,atime):
         atime = atime & 0xFF
-        self._atime = atime
         self._write_reg(self.TSL2541_REG_ATIME, atime)
+        self._atime = atime
+    
+    ''' 
+        @brief  Get the integration time last set with set_integration_time()
+        @return  ATIME(range: 0x00 -0xff)
+    '''
+    def get_integration_time(self):
+        return self._atime
     
     ''' 
         @brief  Set wait time 
@@ -199,8 +388,8 @@ class DFRobot_TSL2541:
     '''
     def set_wait_time(self,wtime):
         wtime = wtime & 0xFF
-        self._wtime = wtime
         self._write_reg(self.TSL2541_REG_WTIME, wtime)
+        self._wtime = wtime
     
     ''' 
         @brief  Set the channel 0 interrupt threshold
@@ -212,10 +401,11 @@ class DFRobot_TSL2541:
         ailth = (ailt>>8) & 0xFF
         aihtl = aiht & 0xFF
         aihth = (aiht>>8) & 0xFF
-        self._write_reg(self.TSL2541_REG_AILTL, ailtl)
-        self._write_reg(self.TSL2541_REG_AILTH, ailth)
-        self._write_reg(self.TSL2541_REG_AIHTL, aihtl)
-        self._write_reg(self.TSL2541_REG_AIHTH, aihth)
+        with self.transaction():
+            self._write_reg(self.TSL2541_REG_AILTL, ailtl)
+            self._write_reg(self.TSL2541_REG_AILTH, ailth)
+            self._write_reg(self.TSL2541_REG_AIHTL, aihtl)
+            self._write_reg(self.TSL2541_REG_AIHTH, aihth)
     
     ''' 
         @brief  Set the channel 0 interrupt Persistence
@@ -231,53 +421,118 @@ class DFRobot_TSL2541:
     '''
     def set_wait_long_time(self,mode=True):
         if mode == True:
-            self._write_reg(self.TSL2541_REG_CFG0, self.CONFIG_NO_WLONG)
+            self._write_reg(self.TSL2541_REG_CFG0, self.CONFIG_WLONG)
             self._wlong = 1
         if mode == False:
-            self._write_reg(self.TSL2541_REG_CFG0, self.CONFIG_WLONG)
+            self._write_reg(self.TSL2541_REG_CFG0, self.CONFIG_NO_WLONG)
             self._wlong = 0
     
     ''' 
         @brief  Set the ALS gain 
-        @param  gain  the value of gain(range: 0x00 -0x03)
+        @param  gain  the value of gain(range: 0 - 5, 1/2X 1X 4X 16X 64X 128X)
     '''
     def set_als_gain(self,gain):
         if gain > 0 and gain < 5:
-            buf1 = self._read_reg(self.TSL2541_REG_CFG1) & 0xFC
-            gain = gain - 1
-            buf1 = buf1 | gain
+            buf1 = self._read_shadow_reg(self.TSL2541_REG_CFG1) & 0xFC
+            buf1 = buf1 | (gain - 1)
             self._write_reg(self.TSL2541_REG_CFG1, buf1)
-            buf2 = self._read_reg(self.TSL2541_REG_CFG2) & 0xEF
-            buf2 = buf2 & 0x04
+            buf2 = self._read_shadow_reg(self.TSL2541_REG_CFG2) & 0xEF
+            buf2 = buf2 | 0x04
             self._write_reg(self.TSL2541_REG_CFG2, buf2)
         elif gain == 0:
-            buf1 = self._read_reg(self.TSL2541_REG_CFG1) & 0xFC
+            buf1 = self._read_shadow_reg(self.TSL2541_REG_CFG1) & 0xFC
             self._write_reg(self.TSL2541_REG_CFG1, buf1)
-            buf2 = self._read_reg(self.TSL2541_REG_CFG2) & 0xEB
+            buf2 = self._read_shadow_reg(self.TSL2541_REG_CFG2) & 0xEB
             self._write_reg(self.TSL2541_REG_CFG2, buf2)
         elif gain == 5:
-            buf1 = self._read_reg(self.TSL2541_REG_CFG1) | 0x03
+            buf1 = self._read_shadow_reg(self.TSL2541_REG_CFG1) | 0x03
             self._write_reg(self.TSL2541_REG_CFG1, buf1)
-            buf2 = self._read_reg(self.TSL2541_REG_CFG2) | 0x14
+            buf2 = self._read_shadow_reg(self.TSL2541_REG_CFG2) | 0x14
             self._write_reg(self.TSL2541_REG_CFG2, buf2)
+        if gain >= 0 and gain <= 5:
+            self._gain = gain
+    
+    ''' 
+        @brief  Get the ALS gain last set with set_als_gain()
+        @return  the value of gain(range: 0 - 5)
+    '''
+    def get_als_gain(self):
+        return self._gain
+    
+    ''' 
+        @brief  Read the visible and IR channels in one I2C block transaction
+        @n      VISDATAL..IRDATAH are fetched together so both values come from the same ALS cycle
+        @return  (vis, ir) the visble data and the IR data
+    '''
+    def read_channels(self):
+        buf = self._read_block(self.TSL2541_REG_VISDATAL, 4)
+        return (buf[0] | (buf[1] << 8), buf[2] | (buf[3] << 8))
+    
+    ''' 
+        @brief  Read STATUS and both channels in one I2C block transaction
+        @n      STATUS..IRDATAH are contiguous, the flags are cleared by the read when int_read_clear is set
+        @return  (status, vis, ir)
+    '''
+    def read_status_channels(self):
+        buf = self._read_block(self.TSL2541_REG_STATUS, 5)
+        return (buf[0], buf[1] | (buf[2] << 8), buf[3] | (buf[4] << 8))
     
     ''' 
         @brief 获取可见光强度的值
         @return  the visble data
     '''
     def get_visble_data(self):
-        dataL = self._read_reg(self.TSL2541_REG_VISDATAL)
-        dataH = self._read_reg(self.TSL2541_REG_VISDATAH)
-        return dataL | (dataH << 8)
+        return self.read_channels()[0]
     
     ''' 
         @brief 获取红外光强度的值
         @return  the IR data
     '''
     def get_IR_data(self):
-        dataL = self._read_reg(self.TSL2541_REG_IRDATAL)
-        dataH = self._read_reg(self.TSL2541_REG_IRDATAH)
-        return dataL | (dataH << 8)
+        return self.read_channels()[1]
+    
+    '''
+        @brief  Get the time between two ALS results from the cached ATIME, WTIME and WLONG settings
+        @return  the cycle period in seconds
+    '''
+    def cycle_period(self):
+        period = (self._atime + 1) * self.CYCLE_STEP
+        if self._read_shadow_reg(self.TSL2541_REG_ENABLE) & 0x08:
+            wait = (self._wtime + 1) * self.CYCLE_STEP
+            if self._wlong:
+                wait = wait * 12
+            period = period + wait
+        return period
+    
+    '''
+        @brief  Check whether an ALS cycle has completed since the ADC was enabled
+        @return  True if AVALID is set in STATUS2
+    '''
+    def is_data_valid(self):
+        return (self._read_reg(self.TSL2541_REG_STATUS2) & self.STATUS2_AVALID) != 0
+    
+    '''
+        @brief  Yield every new ALS result once, sleeping between cycles instead of busy-waiting
+        @n      AVALID stays set after the first cycle, so it cannot tell a new result from one already read.
+        @n      While the stream runs APERS is 0, so every finished cycle sets AINT, and a result is yielded
+        @n      only when the burst read of STATUS and both channels saw AINT. AINT is then cleared, by the
+        @n      read itself with int_read_clear or else by writing AINT alone. PERS is restored when the
+        @n      generator ends or is closed. CFG3 is not changed.
+        @exception RuntimeError  if the ALS or saturation interrupt is enabled, whose INT and flags stream() would take over
+        @n      Call it again after changing ATIME, WTIME or WLONG so the new period is used.
+        @param  count  number of samples to yield, None for an endless stream
+        @param  period  cycle period in seconds, None to compute it with cycle_period()
+        @return  (timestamp, vis, ir) for each sample, timestamp from time.time()
+    '''
+    def stream(self, count = None, period = None):
+        if period is None:
+            period = self.cycle_period()
+        pers = self._stream_start()
+        try:
+            for sample in self._new_results(count, period, time.time):
+                yield sample
+        finally:
+            self._stream_stop(pers)
     
     '''
         @brief  If this bit is set, all flag bits in the STATUS register will be reset whenever the STATUS register is read over I2C. 
@@ -285,10 +540,10 @@ class DFRobot_TSL2541:
     '''
     def set_int_read_clear(self,mode=True):
         if mode == True:
-            buf = self._read_reg(self.TSL2541_REG_CFG3)|0x80
+            buf = self._read_shadow_reg(self.TSL2541_REG_CFG3)|0x80
             self._write_reg(self.TSL2541_REG_CFG3, buf)
         if mode == False:
-            buf = self._read_reg(self.TSL2541_REG_CFG3)&0x7F
+            buf = self._read_shadow_reg(self.TSL2541_REG_CFG3)&0x7F
             self._write_reg(self.TSL2541_REG_CFG3, buf)
     
     '''
@@ -297,10 +552,10 @@ class DFRobot_TSL2541:
     '''
     def set_sleep_after_interrupt(self,mode=True):
         if mode == True:
-            buf = self._read_reg(self.TSL2541_REG_CFG3)|0x10
+            buf = self._read_shadow_reg(self.TSL2541_REG_CFG3)|0x10
             self._write_reg(self.TSL2541_REG_CFG3, buf)
         if mode == False:
-            buf = self._read_reg(self.TSL2541_REG_CFG3)&0xEF
+            buf = self._read_shadow_reg(self.TSL2541_REG_CFG3)&0xEF
             self._write_reg(self.TSL2541_REG_CFG3, buf)
     
     '''
@@ -309,10 +564,10 @@ class DFRobot_TSL2541:
     '''
     def set_auto_zero_mode(self,mode=0):
         if(mode==1):
-            buf = self._read_reg(self.TSL2541_REG_AZ_CONFIG)|0x80
+            buf = self._read_shadow_reg(self.TSL2541_REG_AZ_CONFIG)|0x80
             self._write_reg(self.TSL2541_REG_AZ_CONFIG, buf)
         if(mode==0):
-            buf = self._read_reg(self.TSL2541_REG_AZ_CONFIG)&0x7F
+            buf = self._read_shadow_reg(self.TSL2541_REG_AZ_CONFIG)&0x7F
             self._write_reg(self.TSL2541_REG_AZ_CONFIG, buf)
     
     ''' 
@@ -321,7 +576,7 @@ class DFRobot_TSL2541:
     '''
     def set_auto_zero_nth_iteration(self,iteration_type):
         iteration_type = iteration_type & 0x7F
-        buf = self._read_reg(self.TSL2541_REG_AZ_CONFIG)|iteration_type
+        buf = self._read_shadow_reg(self.TSL2541_REG_AZ_CONFIG)|iteration_type
         self._write_reg(self.TSL2541_REG_AZ_CONFIG, buf)
     
     '''
@@ -331,10 +586,10 @@ class DFRobot_TSL2541:
     def set_als_interrupt(self,mode=True):
         self.set_int_read_clear(True)
         if(mode==True):
-            buf = self._read_reg(self.TSL2541_REG_INTENAB)|0x10
+            buf = self._read_shadow_reg(self.TSL2541_REG_INTENAB)|0x10
             self._write_reg(self.TSL2541_REG_INTENAB, buf)
         if(mode==False):
-            buf = self._read_reg(self.TSL2541_REG_ENABLE)&0xEF
+            buf = self._read_shadow_reg(self.TSL2541_REG_INTENAB)&0xEF
             self._write_reg(self.TSL2541_REG_INTENAB, buf)
     
     '''
@@ -344,17 +599,25 @@ class DFRobot_TSL2541:
     def set_als_saturation_interrupt(self,mode=True):
         self.set_int_read_clear(True);
         if(mode==True):
-            buf = self._read_reg(self.TSL2541_REG_INTENAB)|0x80
+            buf = self._read_shadow_reg(self.TSL2541_REG_INTENAB)|0x80
             self._write_reg(self.TSL2541_REG_INTENAB, buf)
         if(mode==False):
-            buf = self._read_reg(self.TSL2541_REG_INTENAB)&0x7F
+            buf = self._read_shadow_reg(self.TSL2541_REG_INTENAB)&0x7F
             self._write_reg(self.TSL2541_REG_INTENAB, buf)
     
     '''
         @brief  Get the status of the device
+        @return  the STATUS register, the flags are cleared by the read when int_read_clear is set
     '''
     def clear_int_flag(self):
-        self._read_reg(self.TSL2541_REG_STATUS)
+        return self._read_reg(self.TSL2541_REG_STATUS)
+    
+    '''
+        @brief  Clear STATUS flags by writing 1 to them
+        @param  flags  the STATUS bits to clear, e.g. 0x80 for ASAT
+    '''
+    def clear_status_flags(self,flags=0xFF):
+        self._write_reg(self.TSL2541_REG_STATUS, flags & 0xFF)
     
     '''
         @brief  Activating the internal oscillator to permit the timers and ADC channels to operate ,and activing the ALS function
@@ -368,10 +631,10 @@ class DFRobot_TSL2541:
     '''
     def _set_device_power(self,mode=True):
         if(mode==True):
-            buf = self._read_reg(self.TSL2541_REG_ENABLE)|0x01
+            buf = self._read_shadow_reg(self.TSL2541_REG_ENABLE)|0x01
             self._write_reg(self.TSL2541_REG_ENABLE, buf)
         if(mode==False):
-            buf = self._read_reg(self.TSL2541_REG_ENABLE)&0xFE
+            buf = self._read_shadow_reg(self.TSL2541_REG_ENABLE)&0xFE
             self._write_reg(self.TSL2541_REG_ENABLE, buf)
     
     '''
@@ -380,10 +643,10 @@ class DFRobot_TSL2541:
     '''
     def _set_device_adc(self,mode=True):
         if(mode==True):
-            buf = self._read_reg(self.TSL2541_REG_ENABLE)|0x02
+            buf = self._read_shadow_reg(self.TSL2541_REG_ENABLE)|0x02
             self._write_reg(self.TSL2541_REG_ENABLE, buf)
         if(mode==False):
-            buf = self._read_reg(self.TSL2541_REG_ENABLE)&0xFD
+            buf = self._read_shadow_reg(self.TSL2541_REG_ENABLE)&0xFD
             self._write_reg(self.TSL2541_REG_ENABLE, buf)
     
     '''
@@ -400,33 +663,320 @@ class DFRobot_TSL2541:
     def _get_device_id(self):
         return self._read_reg(self.TSL2541_REG_ID)
     
+    '''
+        @brief  Collect register writes and flush them when the block exits
+        @n      Setters called inside the block only update the shadow copy, on exit every contiguous
+        @n      range of changed registers is written with one I2C block write, in address order.
+        @n      If the block or one of the writes raises, the pending writes are dropped, the shadow copy is
+        @n      invalidated and the cached ATIME, WTIME, WLONG and gain go back to their values before the block.
+        @n      The block holds the sensor lock, so register access from other threads waits until it ends;
+        @n      a read-modify-write that another thread may also change belongs in one block.
+    '''
+    @contextmanager
+    def transaction(self):
+        with self._lock:
+            if self._batch is not None:
+                yield self
+                return
+            cached = (self._atime, self._wtime, self._wlong, self._gain)
+            self._batch = {}
+            try:
+                yield self
+                batch = self._batch
+                self._batch = None
+                self._flush(batch)
+            except:
+                self._batch = None
+                self._atime, self._wtime, self._wlong, self._gain = cached
+                self.invalidate_shadow()
+                raise
+    
+    '''
+        @brief  Apply several settings in one transaction
+        @n      Each keyword names a setter without its 'set_' prefix, e.g.
+        @n      configure(integration_time=0x23, als_gain=4, interrupt_threshold=(3000, 10000))
+        @n      A tuple value is passed to the setter as positional arguments.
+    '''
+    def configure(self, **fields):
+        setters = []
+        for name in sorted(fields):
+            setter = getattr(self, 'set_' + name, None)
+            if setter is None:
+                raise ValueError("unknown configuration field '%s'" % name)
+            setters.append((setter, fields[name]))
+        with self.transaction():
+            for setter, value in setters:
+                if isinstance(value, tuple):
+                    setter(*value)
+                else:
+                    setter(value)
+    
+    '''
+        @brief  Attach bus instrumentation to _read_reg/_write_reg and the block transfers
+        @param  metrics  a DFRobot_TSL2541_Metrics, or any object with call(op, reg, length, func, *args); None to detach
+    '''
+    def set_metrics(self, metrics):
+        self._metrics = metrics
+        self._update_io_path()
+    
+    '''
+        @brief  Record every register transfer, e.g. with a DFRobot_TSL2541_TraceRecorder
+        @param  trace  object with record(op, reg, args, result, error=None); None to detach
+    '''
+    def set_trace(self, trace):
+        self._trace = trace
+        self._update_io_path()
+    
+    ''' 
+        @brief  Retry register transfers that fail with IOError, doubling the pause after each attempt
+        @param  retries      extra attempts per transfer, 0 to fail on the first error
+        @param  backoff      pause before the first retry, in seconds
+        @param  max_backoff  longest pause between two attempts, in seconds
+    '''
+    def set_retry_policy(self, retries = 3, backoff = 0.002, max_backoff = 0.05):
+        self._retries = retries
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+        self._update_io_path()
+    
+    '''
+        @brief  Attach a circuit breaker that marks the sensor faulty after repeated failures
+        @param  breaker  a DFRobot_TSL2541_CircuitBreaker, None to detach
+    '''
+    def set_circuit_breaker(self, breaker):
+        if self._breaker is not None:
+            self._breaker.detach()
+        self._breaker = breaker
+        if breaker is not None:
+            breaker.attach(self)
+        self._update_io_path()
+    
+    '''
+        @brief  Reload the shadow copy of the configuration registers from the device
+    '''
+    def resync(self):
+        with self._lock:
+            self._shadow = {}
+            for reg in self.SHADOW_REGS:
+                self._read_shadow_reg(reg)
+    
+    '''
+        @brief  Drop the shadow copy, the next access to each register reads it from the device again
+    '''
+    def invalidate_shadow(self):
+        with self._lock:
+            self._shadow = {}
+    
     '''
         @brief  Initializes all registers of the device
     '''
     def _soft_reset(self):
-        self.set_wait_timer(False)
-        self.set_integration_time(0x23)
-        self.set_wait_time(0)
-        self.set_wait_long_time(False)
-        self.set_als_gain(4)
-        self.set_int_read_clear(False)
-        self.set_sleep_after_interrupt(False)
-        self.set_auto_zero_mode(0)
-        self.set_auto_zero_nth_iteration(0x7F)
-        self.set_als_saturation_interrupt(False)
-        self.set_als_interrupt(False)
+        self.invalidate_shadow()
+        with self.transaction():
+            self.set_wait_timer(False)
+            self.set_integration_time(0x23)
+            self.set_wait_time(0)
+            self.set_wait_long_time(False)
+            self.set_als_gain(4)
+            self.set_int_read_clear(False)
+            self.set_sleep_after_interrupt(False)
+            self.set_auto_zero_mode(0)
+            self.set_auto_zero_nth_iteration(0x7F)
+            self.set_als_saturation_interrupt(False)
+            self.set_als_interrupt(False)
+
+    def _read_config_image(self):
+        # ENABLE..ID in one block, stopping before STATUS so its flags are not cleared by int_read_clear
+        buf = self._read_block(self.TSL2541_REG_ENABLE, self.TSL2541_REG_ID - self.TSL2541_REG_ENABLE + 1)
+        current = dict((self.TSL2541_REG_ENABLE + i, buf[i]) for i in range(len(buf)))
+        for reg in (self.TSL2541_REG_CFG2, self.TSL2541_REG_CFG3, self.TSL2541_REG_AZ_CONFIG, self.TSL2541_REG_INTENAB):
+            current[reg] = self._read_reg(reg)
+        return current
+
+    def _load_config_image(self, image):
+        if isinstance(image, dict):
+            return dict((int(reg, 16) if isinstance(reg, str) else reg, image[reg]) for reg in image)
+        with open(image) as f:
+            return self._load_config_image(json.load(f))
+
+    def _warm_begin(self, image):
+        current = self._read_config_image()
+        if current[self.TSL2541_REG_ID] != self.DEVICE_ID or current[self.TSL2541_REG_REVID] != self.REVISION_ID:
+            return False
+        wanted = None
+        if image is not None and (isinstance(image, dict) or os.path.exists(image)):
+            wanted = self._load_config_image(image)
+        if wanted is None:
+            if current[self.TSL2541_REG_ENABLE] & 0x03 != 0x03:
+                return False
+            wanted = current
+        self._shadow = dict((reg, current[reg]) for reg in self.SHADOW_REGS)
+        enable = wanted.get(self.TSL2541_REG_ENABLE, current[self.TSL2541_REG_ENABLE])
+        with self.transaction():
+            for reg in self.CONFIG_REGS:
+                if reg != self.TSL2541_REG_ENABLE and reg in wanted and wanted[reg] != current[reg]:
+                    self._write_reg(reg, wanted[reg])
+                    current[reg] = wanted[reg]
+        # power and ADC enable go last, after the configuration they run with
+        if enable != current[self.TSL2541_REG_ENABLE]:
+            self._write_reg(self.TSL2541_REG_ENABLE, enable)
+            current[self.TSL2541_REG_ENABLE] = enable
+        self._adopt_config_image(current)
+        return True
+
+    def _adopt_config_image(self, image):
+        self._atime = image.get(self.TSL2541_REG_ATIME, self._atime)
+        self._wtime = image.get(self.TSL2541_REG_WTIME, self._wtime)
+        self._wlong = 1 if self._read_shadow_reg(self.TSL2541_REG_CFG0) & 0x04 else 0
+        cfg1 = self._read_shadow_reg(self.TSL2541_REG_CFG1) & 0x03
+        cfg2 = self._read_shadow_reg(self.TSL2541_REG_CFG2)
+        if cfg2 & 0x10:
+            self._gain = 5
+        elif not cfg2 & 0x04:
+            self._gain = 0
+        else:
+            self._gain = cfg1 + 1
+
+    def _stream_start(self):
+        if self._read_shadow_reg(self.TSL2541_REG_INTENAB) & 0x90:
+            raise RuntimeError('stream() needs AINT for itself, disable the ALS and saturation interrupts first')
+        pers = self._read_shadow_reg(self.TSL2541_REG_PERS)
+        self.set_interrupt_persistence(pers & 0xF0)
+        # drop a flag left by a cycle that finished before the stream started
+        self.clear_status_flags(self.STATUS_AINT)
+        return pers
+
+    def _stream_stop(self, pers):
+        self.set_interrupt_persistence(pers)
+
+    def _new_results(self, count, period, clock):
+        pacer = _StreamPacer(period)
+        n = 0
+        while count is None or n < count:
+            time.sleep(pacer.delay(clock()))
+            result = self._read_new_result()
+            while result is None:
+                time.sleep(pacer.poll())
+                result = self._read_new_result()
+            now = clock()
+            pacer.found(now)
+            n = n + 1
+            yield (now, result[0], result[1])
+
+    def _read_new_result(self):
+        status, vis, ir = self.read_status_channels()
+        if not status & self.STATUS_AINT:
+            return None
+        if not self._read_shadow_reg(self.TSL2541_REG_CFG3) & 0x80:
+            # clear only AINT, ASAT stays for whoever watches it
+            self.clear_status_flags(self.STATUS_AINT)
+        return (vis, ir)
+
+    def _flush(self, batch):
+        for regs in self._ranges(batch):
+            if len(regs) == 1:
+                self._write_reg(regs[0], batch[regs[0]])
+            else:
+                self._write_block(regs[0], [batch[reg] for reg in regs])
+
+    def _ranges(self, regs):
+        regs = sorted(regs)
+        start = 0
+        for i in range(1, len(regs) + 1):
+            if i == len(regs) or regs[i] != regs[i-1] + 1:
+                yield regs[start:i]
+                start = i
 
     def _write_reg(self, reg, buff):
-        self.i2cbus.write_byte_data(self.i2c_addr, reg, buff)
+        with self._lock:
+            if self._batch is not None:
+                self._batch[reg] = buff
+            elif self._plain_io:
+                self.i2cbus.write_byte_data(self.i2c_addr, reg, buff)
+            else:
+                self._transfer('write', reg, 1, self.i2cbus.write_byte_data, self.i2c_addr, reg, buff)
+            if reg in self.SHADOW_REGS:
+                self._shadow[reg] = buff
         
+    def _write_block(self, reg, buf):
+        with self._lock:
+            if self._plain_io:
+                self.i2cbus.write_i2c_block_data(self.i2c_addr, reg, buf)
+            else:
+                self._transfer('write_block', reg, len(buf), self.i2cbus.write_i2c_block_data, self.i2c_addr, reg, buf)
+            for i in range(len(buf)):
+                if reg + i in self.SHADOW_REGS:
+                    self._shadow[reg + i] = buf[i]
+
 
     def _read_reg(self, reg):
-        return self.i2cbus.read_byte_data(self.i2c_addr, reg) 
+        with self._lock:
+            if self._plain_io:
+                return self.i2cbus.read_byte_data(self.i2c_addr, reg) 
+            return self._transfer('read', reg, 1, self.i2cbus.read_byte_data, self.i2c_addr, reg)
 
+    def _read_shadow_reg(self, reg):
+        with self._lock:
+            if reg not in self._shadow:
+                self._shadow[reg] = self._read_reg(reg)
+            return self._shadow[reg]
+
+    def _read_block(self, reg, length):
+        with self._lock:
+            if self._plain_io:
+                return self.i2cbus.read_i2c_block_data(self.i2c_addr, reg, length)
+            return self._transfer('read_block', reg, length, self.i2cbus.read_i2c_block_data, self.i2c_addr, reg, length)
+
+    def _transfer(self, op, reg, length, func, *args):
+        if self._breaker is not None:
+            self._breaker.before()
+        attempt = 0
+        while True:
+            try:
+                if self._metrics is None:
+                    result = func(*args)
+                else:
+                    result = self._metrics.call(op, reg, length, func, *args)
+            except IOError as e:
+                if self._trace is not None:
+                    self._trace.record(op, reg, args, None, e)
+                if attempt >= self._retries:
+                    if self._breaker is not None:
+                        self._breaker.failure()
+                    raise
+                attempt = attempt + 1
+                if self._metrics is not None:
+                    self._metrics.record_retry(op, reg)
+                time.sleep(min(self._backoff * (2 ** (attempt - 1)), self._max_backoff))
+                continue
+            if self._trace is not None:
+                self._trace.record(op, reg, args, result)
+            if self._breaker is not None:
+                self._breaker.success()
+            return result
+
+    def _update_io_path(self):
+        self._plain_io = self._metrics is None and self._retries == 0 and self._breaker is None and self._trace is None
+
+    '''
+        @brief  Check that the device answers on the bus, without retries and even when marked faulty
+        @return  True if the device acknowledged its address
+    '''
     def scan(self):
         try:
-            self.i2cbus.write_quick(self.i2c_addr)
-            return True
-        except:
-            print("I2C init fail")
+            if self._metrics is None:
+                self.i2cbus.write_quick(self.i2c_addr)
+            else:
+                self._metrics.call('quick', 0, 0, self.i2cbus.write_quick, self.i2c_addr)
+        except IOError as e:
+            if self._trace is not None:
+                self._trace.record('quick', 0, (self.i2c_addr,), None, e)
             return False
+        if self._trace is not None:
+            self._trace.record('quick', 0, (self.i2c_addr,), None)
+        return True
+
+# TSL2541_REG_<name> class constants, generated from the register table
+for _reg in REGISTERS:
+    setattr(DFRobot_TSL2541, 'TSL2541_REG_' + _reg[0], _reg[1])
+del _reg
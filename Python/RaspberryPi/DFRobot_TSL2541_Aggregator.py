@@ -0,0 +1,224 @@
+#-*- coding: utf-8 -*-
+""" file DFRobot_TSL2541_Aggregator.py
+  # DFRobot_TSL2541_Aggregator Class infrastructure, per-window min/max/mean/variance/percentile summaries of VIS and IR
+  @copyright   Copyright (c) 2010 DFRobot Co.Ltd (http://www.dfrobot.com)
+  @licence     The MIT License (MIT)
+  @author      [DFRobot]<https://www.dfrobot.com>
+  @version  V1.0
+  @date  2026-10-18
+  @get from https://www.dfrobot.com
+  @url https://github.com/DFRobot/DFRobot_TSL2541
+"""
+import collections
+import math
+
+class _P2(object):
+    '''
+        @brief  P-square estimator of one quantile (Jain & Chlamtac), five markers, constant memory
+    '''
+    def __init__(self, p):
+        self.p = p
+        self.heights = []
+        self.positions = [1, 2, 3, 4, 5]
+        self.desired = [1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5]
+        self.increments = [0, p / 2.0, p, (1 + p) / 2.0, 1]
+
+    def add(self, x):
+        q = self.heights
+        if len(q) < 5:
+            q.append(x)
+            q.sort()
+            return
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+        n = self.positions
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+        for i in range(1, 4):
+            d = self.desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                h = q[i] + d / float(n[i + 1] - n[i - 1]) * ((n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / float(n[i + 1] - n[i]) +
+                                                              (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / float(n[i] - n[i - 1]))
+                if not q[i - 1] < h < q[i + 1]:
+                    h = q[i] + d * (q[i + d] - q[i]) / float(n[i + d] - n[i])
+                q[i] = h
+                n[i] += d
+
+    def value(self):
+        q = self.heights
+        if not q:
+            return None
+        if len(q) < 5:
+            return _nearest_rank(q, self.p)
+        return q[2]
+
+def _nearest_rank(ordered, p):
+    return ordered[min(int(round(p * (len(ordered) - 1))), len(ordered) - 1)]
+
+class _Stats(object):
+    '''
+        @brief  Running count, min, max, mean and variance (Welford) of one channel, plus P-square percentiles
+    '''
+    def __init__(self, percentiles):
+        self.count = 0
+        self.min = None
+        self.max = None
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.quantiles = [_P2(p) for p in percentiles]
+
+    def add(self, x):
+        self.count += 1
+        if self.min is None or x < self.min:
+            self.min = x
+        if self.max is None or x > self.max:
+            self.max = x
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        for q in self.quantiles:
+            q.add(x)
+
+    def summary(self):
+        return {'count': self.count, 'min': self.min, 'max': self.max, 'mean': self.mean,
+                'variance': self.m2 / self.count if self.count else 0.0,
+                'percentiles': dict((q.p, q.value()) for q in self.quantiles)}
+
+def _exact_summary(values, percentiles):
+    count = len(values)
+    mean = math.fsum(values) / count
+    ordered = sorted(values)
+    return {'count': count, 'min': ordered[0], 'max': ordered[-1], 'mean': mean,
+            'variance': math.fsum((x - mean) ** 2 for x in values) / count,
+            'percentiles': dict((p, _nearest_rank(ordered, p)) for p in percentiles)}
+
+class _Tumbling(object):
+    def __init__(self, start, percentiles):
+        self.start = start
+        self.vis = _Stats(percentiles)
+        self.ir = _Stats(percentiles)
+
+class DFRobot_TSL2541_Aggregator:
+    '''
+        @brief  Module init
+        @n      With slide None the windows are fixed (tumbling, aligned to multiples of `window`) and use
+        @n      constant memory per sensor: Welford mean/variance and P-square percentile estimates.
+        @n      With slide set the windows are sliding: a summary of the last `window` seconds is emitted
+        @n      every `slide` seconds, computed exactly from the samples kept for the window.
+        @param  window       window length in seconds
+        @param  slide        seconds between two sliding summaries, None for fixed windows
+        @param  percentiles  quantiles reported for each channel, fractions between 0 and 1
+        @param  on_summary   optional callable(summary) run for each emitted summary
+    '''
+    def __init__(self, window = 1.0, slide = None, percentiles = (0.5, 0.9, 0.99), on_summary = None):
+        if slide is not None and not 0 < slide <= window:
+            raise ValueError('slide must be in (0, window]')
+        self.window = window
+        self.slide = slide
+        self.percentiles = tuple(percentiles)
+        self.on_summary = on_summary
+        self._sensors = {}
+
+    '''
+        @brief  Add one sample
+        @param  name       sensor key
+        @param  timestamp  sample time in seconds
+        @param  vis        visible channel counts
+        @param  ir         IR channel counts
+        @return  list of the summaries closed by this sample, usually empty
+    '''
+    def add(self, name, timestamp, vis, ir):
+        if self.slide is None:
+            return self._add_tumbling(name, timestamp, vis, ir)
+        return self._add_sliding(name, timestamp, vis, ir)
+
+    '''
+        @brief  Aggregate a (timestamp, vis, ir) iterator such as sensor.stream()
+        @param  samples  the iterator
+        @param  name     sensor key
+        @return  generator of summaries, the open window is flushed when the iterator ends
+    '''
+    def summarize(self, samples, name = 'tsl2541'):
+        for timestamp, vis, ir in samples:
+            for summary in self.add(name, timestamp, vis, ir):
+                yield summary
+        for summary in self.flush(name):
+            yield summary
+
+    '''
+        @brief  Emit the open windows
+        @param  name  sensor key, None for every sensor
+        @return  list of summaries
+    '''
+    def flush(self, name = None):
+        names = list(self._sensors) if name is None else [name]
+        summaries = []
+        for key in names:
+            state = self._sensors.pop(key, None)
+            if state is None:
+                continue
+            if self.slide is None:
+                if state.vis.count:
+                    summaries.append(self._emit_tumbling(key, state))
+            else:
+                self._prune(state['samples'], state['next'])
+                if state['samples']:
+                    summaries.append(self._emit_sliding(key, state, state['next']))
+        return summaries
+
+    def _add_tumbling(self, name, timestamp, vis, ir):
+        summaries = []
+        state = self._sensors.get(name)
+        if state is not None and timestamp >= state.start + self.window:
+            summaries.append(self._emit_tumbling(name, state))
+            state = None
+        if state is None:
+            state = self._sensors[name] = _Tumbling(math.floor(timestamp / self.window) * self.window, self.percentiles)
+        state.vis.add(vis)
+        state.ir.add(ir)
+        return summaries
+
+    def _emit_tumbling(self, name, state):
+        return self._emit({'sensor': name, 'start': state.start, 'end': state.start + self.window,
+                           'vis': state.vis.summary(), 'ir': state.ir.summary()})
+
+    def _add_sliding(self, name, timestamp, vis, ir):
+        summaries = []
+        state = self._sensors.get(name)
+        if state is None:
+            state = self._sensors[name] = {'samples': collections.deque(),
+                                           'next': (math.floor(timestamp / self.slide) + 1) * self.slide}
+        while timestamp >= state['next']:
+            self._prune(state['samples'], state['next'])
+            if state['samples']:
+                summaries.append(self._emit_sliding(name, state, state['next']))
+            state['next'] += self.slide
+        state['samples'].append((timestamp, vis, ir))
+        return summaries
+
+    def _prune(self, samples, end):
+        while samples and samples[0][0] < end - self.window:
+            samples.popleft()
+
+    def _emit_sliding(self, name, state, end):
+        samples = state['samples']
+        vis = [s[1] for s in samples]
+        ir = [s[2] for s in samples]
+        return self._emit({'sensor': name, 'start': end - self.window, 'end': end,
+                           'vis': _exact_summary(vis, self.percentiles), 'ir': _exact_summary(ir, self.percentiles)})
+
+    def _emit(self, summary):
+        if self.on_summary is not None:
+            self.on_summary(summary)
+        return summary
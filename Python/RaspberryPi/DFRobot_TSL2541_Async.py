@@ -0,0 +1,129 @@
+#-*- coding: utf-8 -*-
+""" file DFRobot_TSL2541_Async.py
+  # DFRobot_TSL2541_Async Class infrastructure, asyncio front end of DFRobot_TSL2541
+  @copyright   Copyright (c) 2010 DFRobot Co.Ltd (http://www.dfrobot.com)
+  @licence     The MIT License (MIT)
+  @author      [DFRobot]<https://www.dfrobot.com>
+  @version  V1.0
+  @date  2026-10-18
+  @get from https://www.dfrobot.com
+  @url https://github.com/DFRobot/DFRobot_TSL2541
+"""
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from DFRobot_TSL2541 import DFRobot_TSL2541, _StreamPacer
+
+_executors = {}
+_executors_lock = threading.Lock()
+
+def _bus_executor(bus):
+    '''
+        @brief  Get the single-thread executor that serializes every transfer on one I2C bus
+    '''
+    with _executors_lock:
+        if bus not in _executors:
+            _executors[bus] = ThreadPoolExecutor(max_workers=1, thread_name_prefix='tsl2541-bus%s' % bus)
+        return _executors[bus]
+
+class DFRobot_TSL2541_Async:
+    '''
+        @brief  Module init
+        @param  bus       Set to IICBus, or an already opened SMBus-compatible handle
+        @param  int_pin   BCM number of the GPIO wired to INT, None if interrupts are not used
+        @param  executor  executor running the bus transfers, defaults to one worker thread per bus
+    '''
+    def __init__(self, bus = 1, int_pin = None, executor = None):
+        self.sensor = DFRobot_TSL2541(bus)
+        self._executor = executor or _bus_executor(bus if isinstance(bus, int) else id(bus))
+        self._int_pin = int_pin
+        self._loop = None
+        self._int_event = None
+
+    '''
+        @brief  Initialize the device, turn it on and attach the INT pin
+        @return  Whether the device is on or not. True succeed, False failed
+    '''
+    async def begin(self):
+        self._loop = asyncio.get_running_loop()
+        if self._int_pin is not None and self._int_event is None:
+            self._int_event = asyncio.Event()
+            import RPi.GPIO as GPIO
+            if GPIO.getmode() is None:
+                GPIO.setmode(GPIO.BCM)
+            GPIO.setup(self._int_pin, GPIO.IN)
+            GPIO.add_event_detect(self._int_pin, GPIO.FALLING, callback = self._on_int_edge)
+        return await self.run(self.sensor.begin)
+
+    '''
+        @brief  Read the visible and IR channels in one I2C block transaction
+        @return  (vis, ir) the visble data and the IR data
+    '''
+    async def read_channels(self):
+        return await self.run(self.sensor.read_channels)
+
+    '''
+        @brief  Yield every new ALS result once, awaiting between cycles
+        @n      New results are told apart with AINT as in DFRobot_TSL2541.stream(), with the same APERS
+        @n      setting while the stream runs, and the same RuntimeError while an ALS interrupt is enabled.
+        @param  count  number of samples to yield, None for an endless stream
+        @param  period  cycle period in seconds, None to compute it with cycle_period()
+        @return  (timestamp, vis, ir) for each sample, timestamp from the event loop clock
+    '''
+    async def stream(self, count = None, period = None):
+        loop = asyncio.get_running_loop()
+        if period is None:
+            period = await self.run(self.sensor.cycle_period)
+        pers = await self.run(self.sensor._stream_start)
+        try:
+            pacer = _StreamPacer(period)
+            n = 0
+            while count is None or n < count:
+                await asyncio.sleep(pacer.delay(loop.time()))
+                result = await self.run(self.sensor._read_new_result)
+                while result is None:
+                    await asyncio.sleep(pacer.poll())
+                    result = await self.run(self.sensor._read_new_result)
+                now = loop.time()
+                pacer.found(now)
+                n = n + 1
+                yield (now, result[0], result[1])
+        finally:
+            await self.run(self.sensor._stream_stop, pers)
+
+    '''
+        @brief  Wait for a falling edge on the INT pin, then read and clear the interrupt flags
+        @param  timeout  seconds to wait, None to wait forever
+        @return  the STATUS register, None on timeout
+    '''
+    async def wait_for_interrupt(self, timeout = None):
+        if self._int_event is None:
+            raise RuntimeError('no int_pin configured, or begin() has not been awaited')
+        try:
+            await asyncio.wait_for(self._int_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        self._int_event.clear()
+        return await self.run(self.sensor.clear_int_flag)
+
+    '''
+        @brief  Run a blocking DFRobot_TSL2541 call on the bus executor
+        @param  func  the method to call, e.g. self.sensor.set_als_gain
+        @return  the result of func
+    '''
+    async def run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    '''
+        @brief  Detach the INT pin
+    '''
+    def close(self):
+        if self._int_event is not None:
+            import RPi.GPIO as GPIO
+            GPIO.remove_event_detect(self._int_pin)
+            self._int_event = None
+
+    def _on_int_edge(self, channel):
+        self._loop.call_soon_threadsafe(self._int_event.set)
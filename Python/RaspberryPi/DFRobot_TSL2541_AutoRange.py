@@ -0,0 +1,94 @@
+#-*- coding: utf-8 -*-
+""" file DFRobot_TSL2541_AutoRange.py
+  # DFRobot_TSL2541_AutoRange Class infrastructure, automatic gain and integration time ranging
+  @copyright   Copyright (c) 2010 DFRobot Co.Ltd (http://www.dfrobot.com)
+  @licence     The MIT License (MIT)
+  @author      [DFRobot]<https://www.dfrobot.com>
+  @version  V1.0
+  @date  2026-10-18
+  @get from https://www.dfrobot.com
+  @url https://github.com/DFRobot/DFRobot_TSL2541
+"""
+import time
+from DFRobot_TSL2541 import DFRobot_TSL2541
+
+class DFRobot_TSL2541_AutoRange:
+    # Gain multiplier of each set_als_gain() value
+    GAIN_VALUES                        = (0.5, 1, 4, 16, 64, 128)
+    # ATIME values the controller chooses from, 2.78ms to 711ms
+    ATIME_STEPS                        = (0x00, 0x03, 0x08, 0x11, 0x23, 0x47, 0x8F, 0xFF)
+
+    '''
+        @brief  Module init
+        @n      Every (gain, ATIME) pair is ranked by sensitivity (gain * integration cycles) once.
+        @n      From the last reading's count per unit of sensitivity the controller predicts the count of
+        @n      every pair and jumps straight to the most sensitive one that stays under the target.
+        @param  sensor     an initialized DFRobot_TSL2541
+        @param  target     wanted count, as a fraction of the full scale of the chosen ATIME
+        @param  low        rerange when the count falls below this fraction of full scale
+        @param  high       rerange when the count rises above this fraction of full scale
+        @param  max_atime  longest ATIME allowed, bounds the sample period
+    '''
+    def __init__(self, sensor, target = 0.5, low = 0.1, high = 0.9, max_atime = 0xFF):
+        self.sensor = sensor
+        self._target = target
+        self._low = low
+        self._high = high
+        self._table = []
+        for atime in self.ATIME_STEPS:
+            if atime > max_atime:
+                continue
+            cycles = atime + 1
+            full_scale = min(cycles * 1024 - 1, 65535)
+            for gain in range(len(self.GAIN_VALUES)):
+                self._table.append((self.GAIN_VALUES[gain] * cycles, gain, atime, full_scale))
+        self._table.sort()
+        self._pending = 0
+
+    '''
+        @brief  Take one reading and adjust gain and ATIME for the next one
+        @return  (vis, ir, gain, atime, saturated), gain and atime are the settings the reading was taken with
+    '''
+    def sample(self):
+        if self._pending > 0:
+            time.sleep(self._pending)
+            self._pending = 0
+        status, vis, ir = self.sensor.read_status_channels()
+        gain = self.sensor.get_als_gain()
+        atime = self.sensor.get_integration_time()
+        full_scale = min((atime + 1) * 1024 - 1, 65535)
+        saturated = (status & DFRobot_TSL2541.STATUS_ASAT) != 0 or max(vis, ir) >= full_scale
+        if status & DFRobot_TSL2541.STATUS_ASAT:
+            self.sensor.clear_status_flags(DFRobot_TSL2541.STATUS_ASAT)
+        choice = self.choose(max(vis, ir), gain, atime, saturated)
+        if choice != (gain, atime):
+            old_period = self.sensor.cycle_period()
+            with self.sensor.transaction():
+                self.sensor.set_als_gain(choice[0])
+                self.sensor.set_integration_time(choice[1])
+            # the cycle in progress still runs with the old settings
+            self._pending = old_period + self.sensor.cycle_period()
+        return (vis, ir, gain, atime, saturated)
+
+    '''
+        @brief  Pick the settings for the next reading
+        @param  count      the larger of the visible and IR counts
+        @param  gain       the set_als_gain() value the count was taken with
+        @param  atime      the ATIME the count was taken with
+        @param  saturated  whether the reading saturated
+        @return  (gain, atime)
+    '''
+    def choose(self, count, gain, atime, saturated):
+        sensitivity = self.GAIN_VALUES[gain] * (atime + 1)
+        full_scale = min((atime + 1) * 1024 - 1, 65535)
+        if not saturated and self._low * full_scale <= count <= self._high * full_scale:
+            return (gain, atime)
+        if saturated:
+            # the true level is unknown, assume the count was 16 times higher
+            count = full_scale * 16
+        rate = float(count) / sensitivity
+        best = self._table[0]
+        for entry in self._table:
+            if rate * entry[0] <= self._target * entry[3]:
+                best = entry
+        return (best[1], best[2])
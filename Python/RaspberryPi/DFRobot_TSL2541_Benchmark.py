@@ -0,0 +1,210 @@
+#-*- coding: utf-8 -*-
+""" file DFRobot_TSL2541_Benchmark.py
+  # Bus cost benchmark of every public DFRobot_TSL2541 method, run against DFRobot_TSL2541_Emulator
+  # @n Usage: python DFRobot_TSL2541_Benchmark.py [--repeat N] [--latency SECONDS] [--budget OP=TRANSACTIONS ...]
+  # @n The exit status is 1 when an operation needs more bus transactions than its budget, or a gain
+  # @n setting does not reach the emulated device as a valid gain.
+  @copyright   Copyright (c) 2010 DFRobot Co.Ltd (http://www.dfrobot.com)
+  @licence     The MIT License (MIT)
+  @author      [DFRobot]<https://www.dfrobot.com>
+  @version  V1.0
+  @date  2026-10-18
+  @get from https://www.dfrobot.com
+  @url https://github.com/DFRobot/DFRobot_TSL2541
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from DFRobot_TSL2541 import DFRobot_TSL2541
+from DFRobot_TSL2541_Converter import DFRobot_TSL2541_Converter
+from DFRobot_TSL2541_Emulator import DFRobot_TSL2541_Emulator
+from DFRobot_TSL2541_Profiles import DFRobot_TSL2541_Profiles
+
+def _configure_transaction(sensor):
+    with sensor.transaction():
+        sensor.set_integration_time(0x11)
+        sensor.set_als_gain(3)
+        sensor.set_interrupt_threshold(1000, 5000)
+
+_IMAGE_PATH = os.path.join(tempfile.gettempdir(), 'tsl2541_benchmark_image.json')
+_PROFILES = DFRobot_TSL2541_Profiles()
+
+def _profile_switch(sensor):
+    _PROFILES.apply(sensor, 'low-power')
+    _PROFILES.apply(sensor, 'indoor')
+
+# name -> callable(sensor), one entry per public method plus the composite operations
+OPERATIONS = [
+    ('begin',                        lambda s: s.begin()),
+    ('begin_warm',                   lambda s: s.begin(warm = True)),
+    ('_soft_reset',                  lambda s: s._soft_reset()),
+    ('config_image',                 lambda s: s.config_image()),
+    ('save_config_image',            lambda s: s.save_config_image(_IMAGE_PATH)),
+    ('write_config_image',           lambda s: s.write_config_image(_PROFILES.image('indoor'))),
+    ('profile_switch',               _profile_switch),
+    ('set_wait_timer',               lambda s: s.set_wait_timer(True)),
+    ('set_integration_time',         lambda s: s.set_integration_time(0x23)),
+    ('get_integration_time',         lambda s: s.get_integration_time()),
+    ('set_wait_time',                lambda s: s.set_wait_time(0x00)),
+    ('set_interrupt_threshold',      lambda s: s.set_interrupt_threshold(3000, 10000)),
+    ('set_interrupt_persistence',    lambda s: s.set_interrupt_persistence(0x01)),
+    ('set_wait_long_time',           lambda s: s.set_wait_long_time(False)),
+    ('set_als_gain',                 lambda s: s.set_als_gain(4)),
+    ('get_als_gain',                 lambda s: s.get_als_gain()),
+    ('read_channels',                lambda s: s.read_channels()),
+    ('read_status_channels',         lambda s: s.read_status_channels()),
+    ('get_visble_data',              lambda s: s.get_visble_data()),
+    ('get_IR_data',                  lambda s: s.get_IR_data()),
+    ('vis_ir_sample',                lambda s: (s.get_visble_data(), s.get_IR_data())),
+    ('cycle_period',                 lambda s: s.cycle_period()),
+    ('is_data_valid',                lambda s: s.is_data_valid()),
+    ('stream',                       lambda s: next(s.stream(count = 1))),
+    ('set_int_read_clear',           lambda s: s.set_int_read_clear(False)),
+    ('set_sleep_after_interrupt',    lambda s: s.set_sleep_after_interrupt(False)),
+    ('set_auto_zero_mode',           lambda s: s.set_auto_zero_mode(0)),
+    ('set_auto_zero_nth_iteration',  lambda s: s.set_auto_zero_nth_iteration(0x7F)),
+    ('set_als_interrupt',            lambda s: s.set_als_interrupt(False)),
+    ('set_als_saturation_interrupt', lambda s: s.set_als_saturation_interrupt(False)),
+    ('clear_int_flag',               lambda s: s.clear_int_flag()),
+    ('clear_status_flags',           lambda s: s.clear_status_flags(0x80)),
+    ('transaction',                  _configure_transaction),
+    ('configure',                    lambda s: s.configure(integration_time = 0x23, als_gain = 4, interrupt_threshold = (3000, 10000))),
+    ('resync',                       lambda s: s.resync()),
+    ('invalidate_shadow',            lambda s: s.invalidate_shadow()),
+    ('set_metrics',                  lambda s: s.set_metrics(None)),
+    ('set_retry_policy',             lambda s: s.set_retry_policy(0)),
+    ('set_circuit_breaker',          lambda s: s.set_circuit_breaker(None)),
+    ('set_trace',                    lambda s: s.set_trace(None)),
+    ('scan',                         lambda s: s.scan()),
+]
+
+# Bus transactions each operation may use, raise them only together with the change that needs it
+DEFAULT_BUDGETS = {
+    'begin':                   17,
+    'begin_warm':              5,
+    '_soft_reset':             14,
+    'set_als_gain':            2,
+    'set_interrupt_threshold': 1,
+    'read_channels':           1,
+    'vis_ir_sample':           2,
+    'configure':               4,
+    'write_config_image':      4,
+    'profile_switch':          12,
+}
+
+'''
+    @brief  Get a percentile of sorted values by nearest rank
+'''
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    index = min(int(round(fraction * (len(values) - 1))), len(values) - 1)
+    return values[index]
+
+'''
+    @brief  Measure the bus cost of every operation
+    @param  repeat   number of timed runs of each operation
+    @param  latency  seconds the emulator sleeps in each transaction
+    @return  list of dicts with name, transactions, bytes_read, bytes_written, p50, p90, p99, max (seconds)
+'''
+def run(repeat = 20, latency = 0.0):
+    bus = DFRobot_TSL2541_Emulator(latency = latency)
+    bus.set_light(10, 2)
+    sensor = DFRobot_TSL2541(bus)
+    sensor.begin()
+    results = []
+    for name, operation in OPERATIONS:
+        operation(sensor)
+        bus.reset_counters()
+        durations = []
+        for i in range(repeat):
+            start = time.perf_counter()
+            operation(sensor)
+            durations.append(time.perf_counter() - start)
+        durations.sort()
+        results.append({
+            'name':          name,
+            'transactions':  float(bus.transactions) / repeat,
+            'bytes_read':    float(bus.bytes_read) / repeat,
+            'bytes_written': float(bus.bytes_written) / repeat,
+            'p50':           percentile(durations, 0.50),
+            'p90':           percentile(durations, 0.90),
+            'p99':           percentile(durations, 0.99),
+            'max':           durations[-1],
+        })
+    return results
+
+'''
+    @brief  List the public DFRobot_TSL2541 methods that have no entry in OPERATIONS
+'''
+def uncovered():
+    names = set(name for name, operation in OPERATIONS)
+    return sorted(name for name in dir(DFRobot_TSL2541)
+                  if not name.startswith('_') and callable(getattr(DFRobot_TSL2541, name)) and name not in names)
+
+'''
+    @brief  Compare the results with the transaction budgets
+    @return  list of (name, transactions, budget) for every operation over budget
+'''
+def check_budgets(results, budgets):
+    failures = []
+    for result in results:
+        budget = budgets.get(result['name'])
+        if budget is not None and result['transactions'] > budget:
+            failures.append((result['name'], result['transactions'], budget))
+    return failures
+
+'''
+    @brief  Check that every set_als_gain() value reaches the device as a valid gain, from each other value
+    @return  list of (from, to, device gain) for every wrong transition
+'''
+def check_gains():
+    bus = DFRobot_TSL2541_Emulator()
+    sensor = DFRobot_TSL2541(bus)
+    sensor.begin()
+    failures = []
+    gains = range(len(DFRobot_TSL2541_Converter.GAIN_VALUES))
+    for before in gains:
+        for after in gains:
+            sensor.set_als_gain(before)
+            sensor.set_als_gain(after)
+            if bus.als_gain != DFRobot_TSL2541_Converter.GAIN_VALUES[after]:
+                failures.append((before, after, bus.als_gain))
+    return failures
+
+def report(results, out = sys.stdout):
+    out.write('%-30s %6s %7s %7s %9s %9s %9s %9s\n' % ('operation', 'xfers', 'rd B', 'wr B', 'p50 us', 'p90 us', 'p99 us', 'max us'))
+    for r in results:
+        out.write('%-30s %6.1f %7.1f %7.1f %9.1f %9.1f %9.1f %9.1f\n' % (r['name'], r['transactions'],
+                  r['bytes_read'], r['bytes_written'], r['p50'] * 1e6, r['p90'] * 1e6, r['p99'] * 1e6, r['max'] * 1e6))
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = 'Bus cost of every DFRobot_TSL2541 operation')
+    parser.add_argument('--repeat', type = int, default = 20, help = 'timed runs per operation')
+    parser.add_argument('--latency', type = float, default = 0.0, help = 'seconds injected in every bus transaction')
+    parser.add_argument('--budget', action = 'append', default = [], metavar = 'OP=N',
+                        help = 'maximum transactions for an operation, overrides the default budget')
+    args = parser.parse_args(argv)
+    budgets = dict(DEFAULT_BUDGETS)
+    for item in args.budget:
+        name, value = item.split('=', 1)
+        budgets[name] = float(value)
+    results = run(args.repeat, args.latency)
+    report(results)
+    status = 0
+    missing = uncovered()
+    if missing:
+        print('not benchmarked: %s' % ', '.join(missing))
+        status = 1
+    for name, transactions, budget in check_budgets(results, budgets):
+        print('over budget: %s uses %.1f transactions, budget %g' % (name, transactions, budget))
+        status = 1
+    for before, after, gain in check_gains():
+        print('wrong gain: set_als_gain(%d) after set_als_gain(%d) gives %s on the device' % (after, before, gain))
+        status = 1
+    return status
+
+if __name__ == "__main__":
+    sys.exit(main())
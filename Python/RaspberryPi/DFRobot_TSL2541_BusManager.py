@@ -0,0 +1,164 @@
+#-*- coding: utf-8 -*-
+""" file DFRobot_TSL2541_BusManager.py
+  # DFRobot_TSL2541_BusManager Class infrastructure, polls many TSL2541 on several I2C buses and TCA9548 muxes
+  @copyright   Copyright (c) 2010 DFRobot Co.Ltd (http://www.dfrobot.com)
+  @licence     The MIT License (MIT)
+  @author      [DFRobot]<https://www.dfrobot.com>
+  @version  V1.0
+  @date  2026-10-18
+  @get from https://www.dfrobot.com
+  @url https://github.com/DFRobot/DFRobot_TSL2541
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from DFRobot_TSL2541 import DFRobot_TSL2541, get_bus_backend
+
+class _Bus(object):
+    '''
+        @brief  One shared SMBus handle, its mux selection state and the worker thread that owns it
+    '''
+    def __init__(self, handle):
+        self.handle = handle
+        self.lock = threading.RLock()
+        self.muxes = {}
+        self.sensors = []
+        self.executor = ThreadPoolExecutor(max_workers=1)
+
+    '''
+        @brief  Route the bus to a mux channel, writing only the mux control registers that change
+        @param  mux_addr  address of the mux, None for a sensor wired directly to the bus
+        @param  channel   mux channel (0 - 7)
+    '''
+    def select(self, mux_addr, channel):
+        for addr in self.muxes:
+            if addr != mux_addr and self.muxes[addr] != 0:
+                self.handle.write_byte(addr, 0)
+                self.muxes[addr] = 0
+        if mux_addr is not None and self.muxes.get(mux_addr) != 1 << channel:
+            self.handle.write_byte(mux_addr, 1 << channel)
+            self.muxes[mux_addr] = 1 << channel
+
+class _MuxChannel(object):
+    '''
+        @brief  SMBus-compatible view of one mux channel, selects the channel before every transfer
+    '''
+    def __init__(self, bus, mux_addr, channel):
+        self._bus = bus
+        self._mux_addr = mux_addr
+        self._channel = channel
+
+    def write_byte_data(self, addr, reg, value):
+        with self._bus.lock:
+            self._bus.select(self._mux_addr, self._channel)
+            return self._bus.handle.write_byte_data(addr, reg, value)
+
+    def read_byte_data(self, addr, reg):
+        with self._bus.lock:
+            self._bus.select(self._mux_addr, self._channel)
+            return self._bus.handle.read_byte_data(addr, reg)
+
+    def write_i2c_block_data(self, addr, reg, data):
+        with self._bus.lock:
+            self._bus.select(self._mux_addr, self._channel)
+            return self._bus.handle.write_i2c_block_data(addr, reg, data)
+
+    def read_i2c_block_data(self, addr, reg, length):
+        with self._bus.lock:
+            self._bus.select(self._mux_addr, self._channel)
+            return self._bus.handle.read_i2c_block_data(addr, reg, length)
+
+    def write_quick(self, addr):
+        with self._bus.lock:
+            self._bus.select(self._mux_addr, self._channel)
+            return self._bus.handle.write_quick(addr)
+
+class DFRobot_TSL2541_BusManager:
+    TCA9548_IIC_ADDR                   = 0x70
+
+    '''
+        @brief  Module init
+        @param  bus_factory  callable that opens an I2C bus by number, defaults to get_bus_backend()
+    '''
+    def __init__(self, bus_factory = None):
+        self._bus_factory = bus_factory
+        self._buses = {}
+        self._sensors = {}
+
+    '''
+        @brief  Register a sensor
+        @param  name      key used for this sensor in the results
+        @param  bus       I2C bus number
+        @param  mux_addr  TCA9548 address (0x70 - 0x77), None if the sensor is wired directly to the bus
+        @param  channel   mux channel (0 - 7)
+        @return  the DFRobot_TSL2541 instance for the sensor
+    '''
+    def add_sensor(self, name, bus = 1, mux_addr = None, channel = 0):
+        if name in self._sensors:
+            raise ValueError("sensor '%s' already registered" % name)
+        if bus not in self._buses:
+            self._buses[bus] = _Bus((self._bus_factory or get_bus_backend())(bus))
+        shared = self._buses[bus]
+        if mux_addr is not None:
+            shared.muxes.setdefault(mux_addr, None)
+            sensor = DFRobot_TSL2541(_MuxChannel(shared, mux_addr, channel))
+        else:
+            sensor = DFRobot_TSL2541(_MuxChannel(shared, None, 0))
+        shared.sensors.append(name)
+        self._sensors[name] = sensor
+        return sensor
+
+    '''
+        @brief  Get a registered sensor
+        @param  name  the name given to add_sensor
+        @return  the DFRobot_TSL2541 instance
+    '''
+    def sensor(self, name):
+        return self._sensors[name]
+
+    '''
+        @brief  Initialize every sensor, all buses in parallel
+        @return  dict of name -> True succeed, False failed
+    '''
+    def begin(self):
+        return self.run(lambda sensor: sensor.begin())
+
+    '''
+        @brief  Read the visible and IR channels of every sensor, all buses in parallel
+        @return  dict of name -> (vis, ir), None if the sensor did not answer
+    '''
+    def poll(self):
+        return self.run(lambda sensor: sensor.read_channels())
+
+    '''
+        @brief  Call func(sensor) for every sensor on its bus worker thread and gather the results
+        @param  func  callable taking a DFRobot_TSL2541
+        @return  dict of name -> return value, None if func raised an IOError
+    '''
+    def run(self, func):
+        futures = []
+        for bus in self._buses.values():
+            futures.append(bus.executor.submit(self._run_bus, bus, func))
+        results = {}
+        for future in futures:
+            results.update(future.result())
+        return results
+
+    '''
+        @brief  Stop the worker threads and close the bus handles
+    '''
+    def close(self):
+        for bus in self._buses.values():
+            bus.executor.shutdown(wait=True)
+            if hasattr(bus.handle, 'close'):
+                bus.handle.close()
+        self._buses = {}
+        self._sensors = {}
+
+    def _run_bus(self, bus, func):
+        results = {}
+        for name in bus.sensors:
+            try:
+                results[name] = func(self._sensors[name])
+            except IOError:
+                results[name] = None
+        return results
@@ -0,0 +1,90 @@
+#-*- coding: utf-8 -*-
+""" file DFRobot_TSL2541_CircuitBreaker.py
+  # DFRobot_TSL2541_CircuitBreaker Class infrastructure, fast failure and background recovery of a faulty sensor
+  @copyright   Copyright (c) 2010 DFRobot Co.Ltd (http://www.dfrobot.com)
+  @licence     The MIT License (MIT)
+  @author      [DFRobot]<https://www.dfrobot.com>
+  @version  V1.0
+  @date  2026-10-18
+  @get from https://www.dfrobot.com
+  @url https://github.com/DFRobot/DFRobot_TSL2541
+"""
+import errno
+import threading
+from DFRobot_TSL2541 import DFRobot_TSL2541_FaultError
+
+class DFRobot_TSL2541_CircuitBreaker:
+    '''
+        @brief  Module init
+        @n      After `threshold` consecutive failed transfers (after retries) the sensor is marked faulty:
+        @n      every transfer raises DFRobot_TSL2541_FaultError at once, and a background thread probes
+        @n      the device with scan() every `probe_interval` seconds until it answers again.
+        @param  threshold       consecutive failures that mark the sensor faulty
+        @param  probe_interval  seconds between two background scan() probes
+        @param  on_change       optional callable(sensor, faulty) run when the state changes
+    '''
+    def __init__(self, threshold = 3, probe_interval = 1.0, on_change = None):
+        self.threshold = threshold
+        self.probe_interval = probe_interval
+        self.on_change = on_change
+        self._sensor = None
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._faulty = False
+        self._stop = threading.Event()
+        self._thread = None
+
+    '''
+        @brief  Whether the sensor is currently marked faulty
+    '''
+    @property
+    def faulty(self):
+        return self._faulty
+
+    def attach(self, sensor):
+        self._sensor = sensor
+
+    def detach(self):
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+        self._sensor = None
+
+    def before(self):
+        if self._faulty:
+            raise DFRobot_TSL2541_FaultError(errno.EIO, 'sensor marked faulty after %d consecutive failures' % self.threshold)
+
+    def success(self):
+        self._failures = 0
+
+    def failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._faulty or self._failures < self.threshold:
+                return
+            self._faulty = True
+            self._stop.clear()
+            self._thread = threading.Thread(target = self._probe, name = 'tsl2541-probe')
+            self._thread.daemon = True
+            self._thread.start()
+        self._notify(True)
+
+    def _probe(self):
+        while not self._stop.wait(self.probe_interval):
+            sensor = self._sensor
+            if sensor is None:
+                return
+            if sensor.scan():
+                with self._lock:
+                    self._failures = 0
+                    self._faulty = False
+                    self._thread = None
+                # the device may have lost power, reload the configuration mirror on next access
+                sensor.invalidate_shadow()
+                self._notify(False)
+                return
+
+    def _notify(self, faulty):
+        if self.on_change is not None:
+            self.on_change(self._sensor, faulty)
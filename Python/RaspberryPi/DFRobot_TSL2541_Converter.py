@@ -0,0 +1,87 @@
+#-*- coding: utf-8 -*-
+""" file DFRobot_TSL2541_Converter.py
+  # DFRobot_TSL2541_Converter Class infrastructure, vectorized conversion of raw counts to lux and irradiance
+  @copyright   Copyright (c) 2010 DFRobot Co.Ltd (http://www.dfrobot.com)
+  @licence     The MIT License (MIT)
+  @author      [DFRobot]<https://www.dfrobot.com>
+  @version  V1.0
+  @date  2026-10-18
+  @get from https://www.dfrobot.com
+  @url https://github.com/DFRobot/DFRobot_TSL2541
+"""
+import numpy as np
+
+class DFRobot_TSL2541_Converter:
+    # Gain multiplier of each set_als_gain() value
+    GAIN_VALUES                        = np.array([0.5, 1.0, 4.0, 16.0, 64.0, 128.0])
+    # Duration of one integration step, in milliseconds
+    CYCLE_STEP_MS                      = 2.78
+
+    '''
+        @brief  Module init
+        @n      The default factors are nominal, calibrate them against a reference meter behind the
+        @n      actual cover glass for accurate results.
+        @param  glass_attenuation  GA, light lost in the cover glass (1.0 for open air)
+        @param  device_factor      DF, lux per normalized visible count (count / (gain * ms))
+        @param  ir_coefficient     fraction of the IR count subtracted from the visible count before the lux step
+        @param  vis_adjust         VISADJ-style multiplier applied to the raw visible count
+        @param  ir_adjust          multiplier applied to the raw IR count
+        @param  vis_responsivity   visible normalized counts per uW/cm2
+        @param  ir_responsivity    IR normalized counts per uW/cm2
+    '''
+    def __init__(self, glass_attenuation = 1.0, device_factor = 60.0, ir_coefficient = 0.0,
+                 vis_adjust = 1.0, ir_adjust = 1.0, vis_responsivity = 0.37, ir_responsivity = 0.25):
+        self.glass_attenuation = glass_attenuation
+        self.device_factor = device_factor
+        self.ir_coefficient = ir_coefficient
+        self.vis_adjust = vis_adjust
+        self.ir_adjust = ir_adjust
+        self.vis_responsivity = vis_responsivity
+        self.ir_responsivity = ir_responsivity
+
+    '''
+        @brief  Normalize raw counts to counts per unit gain per millisecond of integration
+        @param  counts  raw 16 bit counts, scalar or array
+        @param  gain    set_als_gain() value (0 - 5) of each count, scalar or array
+        @param  atime   ATIME (0x00 - 0xff) of each count, scalar or array
+        @param  mask_saturated  replace counts at the full scale of their ATIME with NaN
+        @return  float64 array broadcast from the inputs
+    '''
+    def normalize(self, counts, gain, atime, mask_saturated = True):
+        counts = np.asarray(counts, dtype = np.float64)
+        cycles = np.asarray(atime, dtype = np.float64) + 1.0
+        scale = self.GAIN_VALUES[np.asarray(gain, dtype = np.intp)] * (cycles * self.CYCLE_STEP_MS)
+        result = counts / scale
+        if mask_saturated:
+            result = np.where(counts >= np.minimum(cycles * 1024.0 - 1.0, 65535.0), np.nan, result)
+        return result
+
+    '''
+        @brief  Convert raw counts to illuminance
+        @param  vis    raw visible counts, scalar or array
+        @param  ir     raw IR counts, scalar or array
+        @param  gain   set_als_gain() value (0 - 5) of each sample, scalar or array
+        @param  atime  ATIME (0x00 - 0xff) of each sample, scalar or array
+        @param  mask_saturated  return NaN for samples where either channel saturated
+        @return  lux as a float64 array, never negative
+    '''
+    def lux(self, vis, ir, gain, atime, mask_saturated = True):
+        vis_n = self.normalize(vis, gain, atime, mask_saturated) * self.vis_adjust
+        ir_n = self.normalize(ir, gain, atime, mask_saturated) * self.ir_adjust
+        lux = (vis_n - self.ir_coefficient * ir_n) * (self.glass_attenuation * self.device_factor)
+        return np.maximum(lux, 0.0)
+
+    '''
+        @brief  Convert raw counts to irradiance on each channel
+        @param  vis    raw visible counts, scalar or array
+        @param  ir     raw IR counts, scalar or array
+        @param  gain   set_als_gain() value (0 - 5) of each sample, scalar or array
+        @param  atime  ATIME (0x00 - 0xff) of each sample, scalar or array
+        @param  mask_saturated  return NaN for saturated counts
+        @return  (vis, ir) in uW/cm2 as float64 arrays
+    '''
+    def irradiance(self, vis, ir, gain, atime, mask_saturated = True):
+        vis_n = self.normalize(vis, gain, atime, mask_saturated) * self.vis_adjust
+        ir_n = self.normalize(ir, gain, atime, mask_saturated) * self.ir_adjust
+        return (vis_n * self.glass_attenuation / self.vis_responsivity,
+                ir_n * self.glass_attenuation / self.ir_responsivity)
@@ -0,0 +1,278 @@
+#-*- coding: utf-8 -*-
+""" file DFRobot_TSL2541_Daemon.py
+  # DFRobot_TSL2541_Daemon Class infrastructure, sampling daemon with one worker process per I2C bus and shared-memory output
+  # @n Usage: python DFRobot_TSL2541_Daemon.py --sensor NAME=BUS[:MUX:CHANNEL] [--sensor ...] [--period S] [--capacity N] [--prefix P]
+  @copyright   Copyright (c) 2010 DFRobot Co.Ltd (http://www.dfrobot.com)
+  @licence     The MIT License (MIT)
+  @author      [DFRobot]<https://www.dfrobot.com>
+  @version  V1.0
+  @date  2026-10-18
+  @get from https://www.dfrobot.com
+  @url https://github.com/DFRobot/DFRobot_TSL2541
+"""
+import argparse
+import multiprocessing
+import signal
+import sys
+import time
+import numpy as np
+from multiprocessing import shared_memory
+from DFRobot_TSL2541_BusManager import DFRobot_TSL2541_BusManager
+from DFRobot_TSL2541_RingBuffer import DFRobot_TSL2541_RingBuffer, SAMPLE_DTYPE
+
+# Segment header, uint64 words in front of the sample ring
+HEADER_SEQUENCE                        = 0   # odd while the writer updates the segment
+HEADER_NEXT                            = 1   # ring index of the next write
+HEADER_TOTAL                           = 2   # samples written since start
+HEADER_CAPACITY                        = 3   # ring capacity in samples
+HEADER_ERRORS                          = 4   # failed reads since start
+HEADER_WORDS                           = 8
+HEADER_SIZE                            = HEADER_WORDS * 8
+
+'''
+    @brief  Name of the shared-memory segment of a sensor
+'''
+def segment_name(prefix, name):
+    return '%s_%s' % (prefix, name)
+
+def _attach(name):
+    # the creating daemon owns the segment, readers and workers must not unlink it on exit
+    try:
+        return shared_memory.SharedMemory(name = name, track = False)
+    except TypeError:
+        # before Python 3.13 attaching registers the segment with the resource tracker, skip that
+        from multiprocessing import resource_tracker
+        register = resource_tracker.register
+        resource_tracker.register = lambda name, rtype: None if rtype == 'shared_memory' else register(name, rtype)
+        try:
+            return shared_memory.SharedMemory(name = name)
+        finally:
+            resource_tracker.register = register
+
+class _Segment(object):
+    '''
+        @brief  Header and sample ring mapped onto one shared-memory segment
+    '''
+    def __init__(self, shm, capacity = None):
+        self.shm = shm
+        self.header = np.ndarray(HEADER_WORDS, dtype = np.uint64, buffer = shm.buf)
+        if capacity is None:
+            capacity = int(self.header[HEADER_CAPACITY])
+        self.ring = DFRobot_TSL2541_RingBuffer(capacity, buffer = shm.buf[HEADER_SIZE:])
+
+    def publish(self, timestamp, status, vis, ir, gain, atime):
+        header = self.header
+        header[HEADER_SEQUENCE] += 1
+        self.ring.append(timestamp, vis, ir, gain, atime, status)
+        header[HEADER_NEXT], header[HEADER_TOTAL] = self.ring.position()
+        header[HEADER_SEQUENCE] += 1
+
+    def close(self):
+        # drop the views first, a segment with exported buffers cannot be closed
+        self.header = None
+        self.ring = None
+        self.shm.close()
+
+def _sample(sensor, stale):
+    if sensor in stale:
+        if not sensor.begin():
+            raise IOError('sensor did not answer')
+        stale.discard(sensor)
+    status, vis, ir = sensor.read_status_channels()
+    return (time.time(), status, vis, ir, sensor.get_als_gain(), sensor.get_integration_time())
+
+def _worker(bus, specs, prefix, period, bus_factory, stop):
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    manager = DFRobot_TSL2541_BusManager(bus_factory)
+    segments = {}
+    stale = set()
+    for name, mux_addr, channel in specs:
+        stale.add(manager.add_sensor(name, bus, mux_addr, channel))
+        segments[name] = _Segment(_attach(segment_name(prefix, name)))
+    deadline = time.time()
+    try:
+        while not stop.is_set():
+            results = manager.run(lambda sensor: _sample(sensor, stale))
+            for name, sample in results.items():
+                if sample is None:
+                    stale.add(manager.sensor(name))
+                    segments[name].header[HEADER_ERRORS] += 1
+                else:
+                    segments[name].publish(*sample)
+            deadline += period
+            delay = deadline - time.time()
+            if delay < 0:
+                deadline = time.time()
+                delay = 0
+            stop.wait(delay)
+    finally:
+        manager.close()
+        for segment in segments.values():
+            segment.close()
+
+class DFRobot_TSL2541_Daemon:
+    '''
+        @brief  Module init
+        @n      The daemon owns every sensor. Each I2C bus gets its own worker process, which samples its sensors
+        @n      every `period` seconds and publishes them to one shared-memory segment per sensor.
+        @n      Readers open the segments with DFRobot_TSL2541_SharedReader and never touch the bus.
+        @param  prefix       prefix of the shared-memory segment names
+        @param  capacity     samples of history kept per sensor
+        @param  period       sampling period in seconds
+        @param  bus_factory  callable that opens an I2C bus by number, defaults to get_bus_backend()
+    '''
+    def __init__(self, prefix = 'tsl2541', capacity = 4096, period = 0.1, bus_factory = None):
+        self.prefix = prefix
+        self.capacity = capacity
+        self.period = period
+        self._bus_factory = bus_factory
+        self._buses = {}
+        self._segments = []
+        self._workers = []
+        self._stop = None
+
+    '''
+        @brief  Register a sensor
+        @param  name      sensor key, also used in the segment name
+        @param  bus       I2C bus number
+        @param  mux_addr  TCA9548 address (0x70 - 0x77), None if the sensor is wired directly to the bus
+        @param  channel   mux channel (0 - 7)
+    '''
+    def add_sensor(self, name, bus = 1, mux_addr = None, channel = 0):
+        for specs in self._buses.values():
+            if name in [spec[0] for spec in specs]:
+                raise ValueError("sensor '%s' already registered" % name)
+        self._buses.setdefault(bus, []).append((name, mux_addr, channel))
+
+    '''
+        @brief  Create the segments and start one worker process per bus
+    '''
+    def start(self):
+        self._stop = multiprocessing.Event()
+        size = HEADER_SIZE + self.capacity * SAMPLE_DTYPE.itemsize
+        for specs in self._buses.values():
+            for name, mux_addr, channel in specs:
+                shm = shared_memory.SharedMemory(name = segment_name(self.prefix, name), create = True, size = size)
+                header = np.ndarray(HEADER_WORDS, dtype = np.uint64, buffer = shm.buf)
+                header[:] = 0
+                header[HEADER_CAPACITY] = self.capacity
+                del header
+                self._segments.append(shm)
+        for bus, specs in self._buses.items():
+            worker = multiprocessing.Process(target = _worker, name = 'tsl2541-bus%d' % bus,
+                                             args = (bus, specs, self.prefix, self.period, self._bus_factory, self._stop))
+            worker.daemon = True
+            worker.start()
+            self._workers.append(worker)
+
+    '''
+        @brief  Stop the workers and remove the segments
+    '''
+    def stop(self):
+        if self._stop is not None:
+            self._stop.set()
+        for worker in self._workers:
+            worker.join()
+        for shm in self._segments:
+            shm.close()
+            shm.unlink()
+        self._workers = []
+        self._segments = []
+        self._stop = None
+
+    '''
+        @brief  Start, run until SIGINT or SIGTERM, then stop
+    '''
+    def serve(self):
+        stop = []
+        signal.signal(signal.SIGTERM, lambda signum, frame: stop.append(signum))
+        self.start()
+        try:
+            while not stop:
+                time.sleep(0.5)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+class DFRobot_TSL2541_SharedReader:
+    '''
+        @brief  Module init
+        @n      Lock-free reader of one sensor segment. latest() and snapshot() return consistent copies,
+        @n      retrying while the writer is active; views() returns live zero-copy views.
+        @param  name    sensor key given to the daemon
+        @param  prefix  prefix of the segment names
+    '''
+    def __init__(self, name, prefix = 'tsl2541'):
+        self._segment = _Segment(_attach(segment_name(prefix, name)))
+
+    '''
+        @brief  Number of samples published since the daemon started
+    '''
+    @property
+    def total(self):
+        return int(self._segment.header[HEADER_TOTAL])
+
+    '''
+        @brief  Number of failed reads since the daemon started
+    '''
+    @property
+    def errors(self):
+        return int(self._segment.header[HEADER_ERRORS])
+
+    '''
+        @brief  Copy of the newest samples, oldest first
+        @param  n  number of samples
+        @return  structured array with the fields of SAMPLE_DTYPE
+    '''
+    def latest(self, n = 1):
+        return self._read(lambda ring: np.array(ring.latest(n)))
+
+    '''
+        @brief  Copy of the whole history, oldest first
+    '''
+    def snapshot(self):
+        return self._read(lambda ring: ring.snapshot())
+
+    '''
+        @brief  Live zero-copy (older, newer) views of the history, the writer may overwrite them while in use
+    '''
+    def views(self):
+        return self._read(lambda ring: ring.views())
+
+    def close(self):
+        self._segment.close()
+
+    def _read(self, func):
+        header = self._segment.header
+        ring = self._segment.ring
+        while True:
+            sequence = int(header[HEADER_SEQUENCE])
+            if sequence & 1:
+                continue
+            ring.set_position(int(header[HEADER_NEXT]), int(header[HEADER_TOTAL]))
+            result = func(ring)
+            if int(header[HEADER_SEQUENCE]) == sequence:
+                return result
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = 'Sample TSL2541 sensors into shared memory')
+    parser.add_argument('--sensor', action = 'append', required = True, metavar = 'NAME=BUS[:MUX:CHANNEL]',
+                        help = 'sensor to sample, MUX is the TCA9548 address in hex')
+    parser.add_argument('--period', type = float, default = 0.1, help = 'sampling period in seconds')
+    parser.add_argument('--capacity', type = int, default = 4096, help = 'samples of history per sensor')
+    parser.add_argument('--prefix', default = 'tsl2541', help = 'prefix of the shared-memory segment names')
+    args = parser.parse_args(argv)
+    daemon = DFRobot_TSL2541_Daemon(args.prefix, args.capacity, args.period)
+    for item in args.sensor:
+        name, location = item.split('=', 1)
+        fields = location.split(':')
+        if len(fields) == 3:
+            daemon.add_sensor(name, int(fields[0]), int(fields[1], 16), int(fields[2]))
+        else:
+            daemon.add_sensor(name, int(fields[0]))
+    daemon.serve()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
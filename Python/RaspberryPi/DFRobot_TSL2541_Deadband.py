@@ -0,0 +1,98 @@
+#-*- coding: utf-8 -*-
+""" file DFRobot_TSL2541_Deadband.py
+  # DFRobot_TSL2541_Deadband Class infrastructure, report-on-change filter with heartbeat for DFRobot_TSL2541 samples
+  @copyright   Copyright (c) 2010 DFRobot Co.Ltd (http://www.dfrobot.com)
+  @licence     The MIT License (MIT)
+  @author      [DFRobot]<https://www.dfrobot.com>
+  @version  V1.0
+  @date  2026-10-18
+  @get from https://www.dfrobot.com
+  @url https://github.com/DFRobot/DFRobot_TSL2541
+"""
+
+class DFRobot_TSL2541_Deadband:
+    '''
+        @brief  Module init
+        @n      A sample is reported when VIS or IR leaves the deadband around the last reported value,
+        @n      or when `heartbeat` seconds passed since the last report. The deadband of a value v is
+        @n      max(absolute, relative * v) counts.
+        @n      With a sensor given, the VIS deadband is also programmed into the ALS thresholds after each
+        @n      report, so the chip raises INT only on a change (the ALS thresholds compare the visible channel).
+        @param  absolute     minimum deadband half width in counts
+        @param  relative     deadband half width as a fraction of the reported value
+        @param  heartbeat    seconds after which a sample is reported anyway, None for no heartbeat
+        @param  sensor       optional DFRobot_TSL2541 whose thresholds follow the deadband
+        @param  persistence  APERS value written by arm(), consecutive out-of-band cycles before INT
+    '''
+    def __init__(self, absolute = 0, relative = 0.0, heartbeat = None, sensor = None, persistence = 0x01):
+        self.absolute = absolute
+        self.relative = relative
+        self.heartbeat = heartbeat
+        self.sensor = sensor
+        self.persistence = persistence
+        self._vis = None
+        self._ir = None
+        self._last = None
+        self._thresholds = None
+
+    '''
+        @brief  Deadband half width around a value
+        @param  value  counts
+    '''
+    def band(self, value):
+        return max(self.absolute, self.relative * value)
+
+    '''
+        @brief  Write the persistence and enable the ALS interrupt of the sensor, thresholds follow on the first report
+        @n      Read the sensor on INT afterwards, sensor.stream() refuses to run while the ALS interrupt is enabled.
+    '''
+    def arm(self):
+        with self.sensor.transaction():
+            self.sensor.set_interrupt_persistence(self.persistence)
+            self.sensor.set_als_interrupt(True)
+        self._thresholds = None
+
+    '''
+        @brief  Forget the last report, the next sample is reported
+    '''
+    def reset(self):
+        self._vis = None
+        self._ir = None
+        self._last = None
+
+    '''
+        @brief  Decide whether a sample is reported
+        @param  timestamp  sample time in seconds
+        @param  vis        visible channel counts
+        @param  ir         IR channel counts
+        @return  True if the sample should be reported
+    '''
+    def update(self, timestamp, vis, ir):
+        if self._last is not None \
+           and abs(vis - self._vis) <= self.band(self._vis) \
+           and abs(ir - self._ir) <= self.band(self._ir) \
+           and (self.heartbeat is None or timestamp - self._last < self.heartbeat):
+            return False
+        self._vis = vis
+        self._ir = ir
+        self._last = timestamp
+        if self.sensor is not None:
+            self._program(vis)
+        return True
+
+    '''
+        @brief  Keep only the reported samples of a (timestamp, vis, ir) iterator such as sensor.stream()
+        @param  samples  the iterator
+        @return  generator of (timestamp, vis, ir)
+    '''
+    def filter(self, samples):
+        for sample in samples:
+            if self.update(sample[0], sample[1], sample[2]):
+                yield sample
+
+    def _program(self, vis):
+        half = int(self.band(vis))
+        thresholds = (max(vis - half, 0), min(vis + half, 0xFFFF))
+        if thresholds != self._thresholds:
+            self.sensor.set_interrupt_threshold(thresholds[0], thresholds[1])
+            self._thresholds = thresholds
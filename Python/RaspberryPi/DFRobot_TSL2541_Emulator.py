@@ -0,0 +1,244 @@
+#-*- coding: utf-8 -*-
+""" file DFRobot_TSL2541_Emulator.py
+  # DFRobot_TSL2541_Emulator Class infrastructure, SMBus-compatible emulation of the TSL2541 register map
+  @copyright   Copyright (c) 2010 DFRobot Co.Ltd (http://www.dfrobot.com)
+  @licence     The MIT License (MIT)
+  @author      [DFRobot]<https://www.dfrobot.com>
+  @version  V1.0
+  @date  2026-10-18
+  @get from https://www.dfrobot.com
+  @url https://github.com/DFRobot/DFRobot_TSL2541
+"""
+import errno
+import threading
+import time
+from DFRobot_TSL2541 import DFRobot_TSL2541 as _TSL, REGISTERS
+
+class DFRobot_TSL2541_Emulator(object):
+    '''
+     * Any object with these SMBus methods can be passed to DFRobot_TSL2541 as the bus:
+     *   read_byte_data(addr, reg)            write_byte_data(addr, reg, value)
+     *   read_i2c_block_data(addr, reg, len)  write_i2c_block_data(addr, reg, data)
+     *   write_quick(addr)
+     * The emulator implements them against an in-memory TSL2541 whose ALS cycles run on a clock.
+    '''
+    # Register values after power on
+    RESET_VALUES                       = dict((reg[1], reg[2]) for reg in REGISTERS)
+    # Registers the host cannot change
+    READ_ONLY_REGS                     = (_TSL.TSL2541_REG_REVID, _TSL.TSL2541_REG_ID, _TSL.TSL2541_REG_VISDATAL,
+                                          _TSL.TSL2541_REG_VISDATAH, _TSL.TSL2541_REG_IRDATAL,
+                                          _TSL.TSL2541_REG_IRDATAH, _TSL.TSL2541_REG_STATUS2)
+    AGAIN_VALUES                       = (1, 4, 16, 64)
+
+    '''
+        @brief  Module init
+        @param  addr     I2C address the emulated device answers on
+        @param  latency  seconds slept in every transaction, to model a slow bus
+        @param  clock    callable returning the time in seconds, time.monotonic by default
+    '''
+    def __init__(self, addr = _TSL.DFRobot_TSL2541_IIC_ADDR, latency = 0, clock = None):
+        self.addr = addr
+        self.latency = latency
+        self._clock = clock or time.monotonic
+        self._lock = threading.RLock()
+        self._light = (0, 0)
+        self.on_interrupt = None
+        self.reset_counters()
+        self.power_on_reset()
+
+    '''
+        @brief  Put every register back to its power-on value
+    '''
+    def power_on_reset(self):
+        with self._lock:
+            self.regs = bytearray(256)
+            for reg in self.RESET_VALUES:
+                self.regs[reg] = self.RESET_VALUES[reg]
+            self._cycle_start = None
+            self._out_of_range = 0
+            self._int_line = False
+
+    '''
+        @brief  Set the light falling on the sensor
+        @param  vis  visible counts per integration step at 1x gain, or a callable t -> (vis, ir)
+        @param  ir   IR counts per integration step at 1x gain
+    '''
+    def set_light(self, vis, ir = 0):
+        with self._lock:
+            self._update()
+            self._light = vis if callable(vis) else (vis, ir)
+
+    '''
+        @brief  Zero the transaction and byte counters
+    '''
+    def reset_counters(self):
+        self.transactions = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.invalid_gain_cycles = 0
+
+    '''
+        @brief  Analog gain set by CFG1 and CFG2
+        @return  0.5 - 128, None if the AGAIN, AGAINL and AGAINMAX bits are not a valid combination
+    '''
+    @property
+    def als_gain(self):
+        with self._lock:
+            return self._gain()
+
+    '''
+        @brief  Whether the INT pin is asserted (active low on the real device)
+    '''
+    @property
+    def int_asserted(self):
+        with self._lock:
+            self._update()
+            self._update_int_line()
+            return self._int_line
+
+    def read_byte_data(self, addr, reg):
+        return self._transfer(addr, 1, 0, lambda: self._read(reg))
+
+    def write_byte_data(self, addr, reg, value):
+        self._transfer(addr, 0, 1, lambda: self._write(reg, value))
+
+    def read_i2c_block_data(self, addr, reg, length):
+        return self._transfer(addr, length, 0, lambda: [self._read((reg + i) & 0xFF) for i in range(length)])
+
+    def write_i2c_block_data(self, addr, reg, data):
+        def write():
+            for i in range(len(data)):
+                self._write((reg + i) & 0xFF, data[i])
+        self._transfer(addr, 0, len(data), write)
+
+    def write_quick(self, addr):
+        self._transfer(addr, 0, 0, lambda: None)
+
+    def close(self):
+        pass
+
+    def _transfer(self, addr, nread, nwrite, func):
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.transactions += 1
+            if addr != self.addr:
+                raise IOError(errno.EREMOTEIO, 'Remote I/O error')
+            self.bytes_read += nread
+            self.bytes_written += nwrite
+            self._update()
+            result = func()
+            self._update_int_line()
+            return result
+
+    def _read(self, reg):
+        value = self.regs[reg]
+        if reg == _TSL.TSL2541_REG_STATUS and self.regs[_TSL.TSL2541_REG_CFG3] & 0x80:
+            self.regs[reg] = 0
+        return value
+
+    def _write(self, reg, value):
+        value = value & 0xFF
+        if reg in self.READ_ONLY_REGS:
+            return
+        if reg == _TSL.TSL2541_REG_STATUS:
+            self.regs[reg] &= ~value & 0xFF
+            return
+        if reg == _TSL.TSL2541_REG_ENABLE:
+            running = (value & 0x03) == 0x03
+            if not running:
+                self._cycle_start = None
+                self.regs[_TSL.TSL2541_REG_STATUS2] &= ~_TSL.STATUS2_AVALID & 0xFF
+            elif self._cycle_start is None:
+                self._cycle_start = self._clock()
+        self.regs[reg] = value
+
+    def _gain(self):
+        again = self.regs[_TSL.TSL2541_REG_CFG1] & 0x03
+        cfg2 = self.regs[_TSL.TSL2541_REG_CFG2]
+        if cfg2 & 0x10:
+            # AGAINMAX is only defined on top of AGAIN 64x with AGAINL set
+            return 128 if again == 3 and cfg2 & 0x04 else None
+        if not cfg2 & 0x04:
+            # AGAINL clear is only defined with AGAIN 1x
+            return 0.5 if again == 0 else None
+        return self.AGAIN_VALUES[again]
+
+    def _cycle_period(self):
+        period = (self.regs[_TSL.TSL2541_REG_ATIME] + 1) * _TSL.CYCLE_STEP
+        if self.regs[_TSL.TSL2541_REG_ENABLE] & 0x08:
+            wait = (self.regs[_TSL.TSL2541_REG_WTIME] + 1) * _TSL.CYCLE_STEP
+            if self.regs[_TSL.TSL2541_REG_CFG0] & 0x04:
+                wait = wait * 12
+            period = period + wait
+        return period
+
+    def _persistence(self):
+        apers = self.regs[_TSL.TSL2541_REG_PERS] & 0x0F
+        if apers < 4:
+            return apers
+        return (apers - 3) * 5
+
+    def _update(self):
+        if self._cycle_start is None:
+            return
+        period = self._cycle_period()
+        now = self._clock()
+        cycles = int((now - self._cycle_start) / period)
+        if cycles <= 0:
+            return
+        status = self.regs[_TSL.TSL2541_REG_STATUS]
+        if self.regs[_TSL.TSL2541_REG_CFG3] & 0x10 and status & _TSL.STATUS_AINT:
+            # sleep after interrupt, no new cycles until the flag is cleared
+            self._cycle_start = now
+            return
+        # the registers only keep the result of the last cycles, older ones are skipped
+        first = max(cycles - 64, 0)
+        for n in range(first, cycles):
+            self._finish_cycle(self._cycle_start + (n + 1) * period)
+            if self.regs[_TSL.TSL2541_REG_CFG3] & 0x10 and self.regs[_TSL.TSL2541_REG_STATUS] & _TSL.STATUS_AINT:
+                break
+        self._cycle_start = self._cycle_start + cycles * period
+
+    def _finish_cycle(self, t):
+        light = self._light(t) if callable(self._light) else self._light
+        steps = self.regs[_TSL.TSL2541_REG_ATIME] + 1
+        full_scale = min(steps * 1024 - 1, 65535)
+        gain = self._gain()
+        if gain is None:
+            # the device gives no defined result, read back zero counts and count the cycle
+            self.invalid_gain_cycles += 1
+            gain = 0
+        vis = int(light[0] * gain * steps)
+        ir = int(light[1] * gain * steps)
+        status = self.regs[_TSL.TSL2541_REG_STATUS]
+        status2 = _TSL.STATUS2_AVALID
+        if vis >= full_scale or ir >= full_scale:
+            status = status | _TSL.STATUS_ASAT
+            status2 = status2 | 0x10
+        vis = min(vis, full_scale)
+        ir = min(ir, full_scale)
+        self.regs[_TSL.TSL2541_REG_VISDATAL] = vis & 0xFF
+        self.regs[_TSL.TSL2541_REG_VISDATAH] = vis >> 8
+        self.regs[_TSL.TSL2541_REG_IRDATAL] = ir & 0xFF
+        self.regs[_TSL.TSL2541_REG_IRDATAH] = ir >> 8
+        low = self.regs[_TSL.TSL2541_REG_AILTL] | (self.regs[_TSL.TSL2541_REG_AILTH] << 8)
+        high = self.regs[_TSL.TSL2541_REG_AIHTL] | (self.regs[_TSL.TSL2541_REG_AIHTH] << 8)
+        if vis < low or vis > high:
+            self._out_of_range += 1
+        else:
+            self._out_of_range = 0
+        persistence = self._persistence()
+        if persistence == 0 or (self._out_of_range >= persistence and self._out_of_range > 0):
+            status = status | _TSL.STATUS_AINT
+        self.regs[_TSL.TSL2541_REG_STATUS] = status
+        self.regs[_TSL.TSL2541_REG_STATUS2] = status2
+
+    def _update_int_line(self):
+        status = self.regs[_TSL.TSL2541_REG_STATUS]
+        intenab = self.regs[_TSL.TSL2541_REG_INTENAB]
+        line = bool((status & _TSL.STATUS_AINT and intenab & 0x10) or (status & _TSL.STATUS_ASAT and intenab & 0x80))
+        edge = line and not self._int_line
+        self._int_line = line
+        if edge and self.on_interrupt is not None:
+            self.on_interrupt()
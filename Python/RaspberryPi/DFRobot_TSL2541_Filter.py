@@ -0,0 +1,215 @@
+#-*- coding: utf-8 -*-
+""" file DFRobot_TSL2541_Filter.py
+  # DFRobot_TSL2541 filter Class infrastructure, incremental EMA, running median and Kalman filters for VIS/IR samples
+  @copyright   Copyright (c) 2010 DFRobot Co.Ltd (http://www.dfrobot.com)
+  @licence     The MIT License (MIT)
+  @author      [DFRobot]<https://www.dfrobot.com>
+  @version  V1.0
+  @date  2026-10-18
+  @get from https://www.dfrobot.com
+  @url https://github.com/DFRobot/DFRobot_TSL2541
+"""
+import bisect
+import collections
+import numpy as np
+from DFRobot_TSL2541_Converter import DFRobot_TSL2541_Converter
+
+# Each filter takes a scalar or an array (one value per sensor or channel) in update(), and a
+# (samples, ...) array in apply(), time along the first axis. filter() wraps a (timestamp, vis, ir)
+# stream such as sensor.stream() and yields (timestamp, vis, ir) with filtered float values.
+
+class DFRobot_TSL2541_EMA:
+    '''
+        @brief  Module init
+        @param  alpha  weight of the newest sample (0 - 1], smaller is smoother
+    '''
+    def __init__(self, alpha = 0.2):
+        self.alpha = alpha
+        self.value = None
+
+    def reset(self):
+        self.value = None
+
+    '''
+        @brief  Add one sample
+        @return  the filtered value
+    '''
+    def update(self, x):
+        if self.value is None:
+            self.value = np.array(x, dtype = np.float64) if np.ndim(x) else float(x)
+        else:
+            self.value = self.value + self.alpha * (x - self.value)
+        return self.value
+
+    '''
+        @brief  Filter a batch, continuing from the current state
+        @param  values  array of shape (samples, ...)
+        @return  float64 array of the same shape
+    '''
+    def apply(self, values, block = 64):
+        values = np.asarray(values, dtype = np.float64)
+        out = np.empty_like(values)
+        if not len(values):
+            return out
+        start = 0
+        if self.value is None:
+            self.value = values[0].copy() if values.ndim > 1 else float(values[0])
+            out[0] = values[0]
+            start = 1
+        # y[j] = (1-a)^(j+1) y[-1] + sum_i a (1-a)^(j-i) x[i], as one small matrix product per block
+        decay = 1.0 - self.alpha
+        powers = decay ** np.arange(block + 1)
+        lags = np.subtract.outer(np.arange(block), np.arange(block))
+        weights = np.where(lags >= 0, self.alpha * powers[np.clip(lags, 0, block)], 0.0)
+        for i in range(start, len(values), block):
+            chunk = values[i:i + block]
+            n = len(chunk)
+            tail = powers[1:n + 1].reshape((n,) + (1,) * (values.ndim - 1))
+            out[i:i + n] = np.tensordot(weights[:n, :n], chunk, axes = 1) + tail * self.value
+            self.value = out[i + n - 1].copy() if values.ndim > 1 else float(out[i + n - 1])
+        return out
+
+    def filter(self, samples, sensor = None):
+        for timestamp, vis, ir in samples:
+            value = self.update(np.array([vis, ir], dtype = np.float64))
+            yield (timestamp, float(value[0]), float(value[1]))
+
+class DFRobot_TSL2541_MedianFilter:
+    '''
+        @brief  Module init
+        @n      Median of the last `window` samples. A scalar stream keeps a sorted window (bisect), an array
+        @n      stream keeps a ring of the last samples and takes the median across it.
+        @param  window  number of samples, odd values give a true middle sample
+    '''
+    def __init__(self, window = 5):
+        self.window = window
+        self.reset()
+
+    def reset(self):
+        self._recent = collections.deque()
+        self._sorted = []
+        self._ring = None
+        self._count = 0
+
+    '''
+        @brief  Add one sample
+        @return  the median of the last window samples
+    '''
+    def update(self, x):
+        if np.ndim(x):
+            return self._update_array(np.asarray(x, dtype = np.float64))
+        x = float(x)
+        self._recent.append(x)
+        bisect.insort(self._sorted, x)
+        if len(self._recent) > self.window:
+            del self._sorted[bisect.bisect_left(self._sorted, self._recent.popleft())]
+        n = len(self._sorted)
+        if n % 2:
+            return self._sorted[n // 2]
+        return (self._sorted[n // 2 - 1] + self._sorted[n // 2]) / 2.0
+
+    '''
+        @brief  Filter a batch, continuing from the current state
+        @param  values  array of shape (samples, ...)
+        @return  float64 array of the same shape
+    '''
+    def apply(self, values):
+        values = np.asarray(values, dtype = np.float64)
+        if not len(values):
+            return values.copy()
+        history = self._history(values.shape[1:])
+        padded = np.concatenate((np.full((self.window - 1 - len(history),) + values.shape[1:], np.nan), history, values))
+        windows = np.lib.stride_tricks.sliding_window_view(padded, self.window, axis = 0)
+        out = np.nanmedian(windows, axis = -1)
+        for value in values[-self.window:]:
+            self.update(value if values.ndim > 1 else float(value))
+        return out
+
+    def filter(self, samples, sensor = None):
+        for timestamp, vis, ir in samples:
+            value = self.update(np.array([vis, ir], dtype = np.float64))
+            yield (timestamp, float(value[0]), float(value[1]))
+
+    def _update_array(self, x):
+        if self._ring is None:
+            self._ring = np.full((self.window,) + x.shape, np.nan)
+        self._ring[self._count % self.window] = x
+        self._count += 1
+        return np.nanmedian(self._ring, axis = 0)
+
+    def _history(self, shape):
+        if self._ring is not None:
+            n = min(self._count, self.window - 1)
+            order = (np.arange(self._count - n, self._count)) % self.window
+            return self._ring[order]
+        recent = list(self._recent)[-(self.window - 1):] if self.window > 1 else []
+        return np.array(recent, dtype = np.float64).reshape((len(recent),) + shape)
+
+class DFRobot_TSL2541_KalmanFilter:
+    '''
+        @brief  Module init
+        @n      1-D random-walk Kalman filter on the light level in counts per unit gain per millisecond, so
+        @n      a gain or ATIME change rescales the measurement instead of looking like a step. The
+        @n      measurement noise, given in counts, shrinks in normalized units as the gain grows.
+        @n      Saturated counts only advance the prediction.
+        @param  process_noise      variance added to the level per sample, in normalized units
+        @param  measurement_noise  variance of one raw count reading, in counts
+    '''
+    def __init__(self, process_noise = 1e-4, measurement_noise = 4.0):
+        self.process_noise = process_noise
+        self.measurement_noise = measurement_noise
+        self.reset()
+
+    def reset(self):
+        self.level = None
+        self.variance = None
+
+    '''
+        @brief  Add one sample
+        @param  counts  raw counts, scalar or array
+        @param  gain    set_als_gain() value (0 - 5) of the counts
+        @param  atime   ATIME (0x00 - 0xff) of the counts
+        @return  the filtered value in counts at this gain and ATIME
+    '''
+    def update(self, counts, gain, atime):
+        counts = np.asarray(counts, dtype = np.float64)
+        cycles = np.asarray(atime, dtype = np.float64) + 1.0
+        scale = DFRobot_TSL2541_Converter.GAIN_VALUES[np.asarray(gain, dtype = np.intp)] * (cycles * DFRobot_TSL2541_Converter.CYCLE_STEP_MS)
+        valid = counts < np.minimum(cycles * 1024.0 - 1.0, 65535.0)
+        measured = counts / scale
+        noise = self.measurement_noise / (scale * scale)
+        if self.level is None:
+            self.level = np.where(valid, measured, np.nan)
+            self.variance = np.where(valid, noise, np.inf)
+        else:
+            variance = self.variance + self.process_noise
+            start = ~np.isfinite(self.level) & valid
+            level = np.where(start, measured, self.level)
+            variance = np.where(start, noise, variance)
+            with np.errstate(invalid = 'ignore'):
+                gain_k = np.where(valid & ~start, variance / (variance + noise), 0.0)
+            self.level = level + gain_k * (np.where(valid, measured, 0.0) - np.nan_to_num(level))
+            self.variance = (1.0 - gain_k) * variance
+        result = self.level * scale
+        return float(result) if np.ndim(result) == 0 else result
+
+    '''
+        @brief  Filter a batch, continuing from the current state
+        @param  values  counts, array of shape (samples, ...)
+        @param  gain    gain value per sample, broadcast against values
+        @param  atime   ATIME per sample, broadcast against values
+        @return  float64 array of the same shape as values
+    '''
+    def apply(self, values, gain, atime):
+        values = np.asarray(values, dtype = np.float64)
+        gain = np.broadcast_to(gain, values.shape)
+        atime = np.broadcast_to(atime, values.shape)
+        out = np.empty_like(values)
+        for i in range(len(values)):
+            out[i] = self.update(values[i], gain[i], atime[i])
+        return out
+
+    def filter(self, samples, sensor):
+        for timestamp, vis, ir in samples:
+            value = self.update(np.array([vis, ir], dtype = np.float64), sensor.get_als_gain(), sensor.get_integration_time())
+            yield (timestamp, float(value[0]), float(value[1]))
@@ -0,0 +1,124 @@
+#-*- coding: utf-8 -*-
+""" file DFRobot_TSL2541_FlickerAnalyzer.py
+  # DFRobot_TSL2541_FlickerAnalyzer Class infrastructure, high-rate burst capture and vectorized flicker analysis
+  @copyright   Copyright (c) 2010 DFRobot Co.Ltd (http://www.dfrobot.com)
+  @licence     The MIT License (MIT)
+  @author      [DFRobot]<https://www.dfrobot.com>
+  @version  V1.0
+  @date  2026-10-18
+  @get from https://www.dfrobot.com
+  @url https://github.com/DFRobot/DFRobot_TSL2541
+"""
+import time
+import numpy as np
+
+# One record per captured ALS cycle, timestamp in time.perf_counter() seconds when the result was read
+CAPTURE_DTYPE = np.dtype([
+    ('timestamp', '<f8'),
+    ('vis',       '<u2'),
+    ('ir',        '<u2'),
+])
+
+class DFRobot_TSL2541_FlickerAnalyzer:
+    '''
+        @brief  Module init
+        @n      capture() switches the sensor to ATIME 0x00 (2.78 ms cycles, wait timer off) and reads STATUS and
+        @n      both channels with one block read per cycle, keeping a result only when AINT marks it as new,
+        @n      like DFRobot_TSL2541.stream(). The previous configuration is restored afterwards.
+        @n      The shortest cycle puts the Nyquist frequency near 180 Hz, enough for 100/120 Hz mains flicker.
+        @param  sensor  an initialized DFRobot_TSL2541
+    '''
+    def __init__(self, sensor):
+        self.sensor = sensor
+
+    '''
+        @brief  Record back-to-back ALS results at the minimum integration time
+        @param  count  number of samples
+        @param  gain   set_als_gain() value for the capture, None to keep the current gain
+        @param  out    optional preallocated CAPTURE_DTYPE array of at least count records
+        @return  CAPTURE_DTYPE array of count records
+    '''
+    def capture(self, count, gain = None, out = None):
+        if out is None:
+            out = np.zeros(count, dtype = CAPTURE_DTYPE)
+        timestamps = out['timestamp']
+        vis = out['vis']
+        ir = out['ir']
+        sensor = self.sensor
+        saved = sensor.config_image()
+        # APERS 0 sets AINT after every cycle, which marks each new result; the interrupts stay off meanwhile
+        fields = {'integration_time': 0x00, 'wait_timer': False, 'interrupt_persistence': saved[sensor.TSL2541_REG_PERS] & 0xF0,
+                  'als_interrupt': False, 'als_saturation_interrupt': False}
+        if gain is not None:
+            fields['als_gain'] = gain
+        sensor.configure(**fields)
+        try:
+            sensor.clear_status_flags(sensor.STATUS_AINT)
+            results = sensor._new_results(count + 1, sensor.cycle_period(), time.perf_counter)
+            # skip the cycle that was running with the old settings
+            next(results)
+            for i, sample in enumerate(results):
+                timestamps[i], vis[i], ir[i] = sample
+        finally:
+            sensor.write_config_image(saved, False)
+        return out[:count]
+
+    '''
+        @brief  Capture and analyze the visible channel
+        @param  count  number of samples
+        @param  gain   set_als_gain() value for the capture, None to keep the current gain
+        @return  the capture and the analyze() result
+    '''
+    def measure(self, count = 1024, gain = None):
+        samples = self.capture(count, gain)
+        return samples, self.analyze(samples['vis'], samples['timestamp'])
+
+    '''
+        @brief  Flicker metrics of one or many waveforms
+        @n      Irregular timestamps are resampled to a uniform grid before the FFT.
+        @param  values      samples along the last axis, shape (n,) or (captures, n)
+        @param  timestamps  sample times in seconds, same shape as values or (n,), None with rate
+        @param  rate        sample rate in Hz when timestamps is None
+        @return  dict of percent_flicker (%), flicker_index, dominant_frequency (Hz), sample_rate (Hz)
+        @n       and mean, each a float or an array with one value per capture
+    '''
+    @staticmethod
+    def analyze(values, timestamps = None, rate = None):
+        values = np.asarray(values, dtype = np.float64)
+        n = values.shape[-1]
+        if timestamps is None:
+            if rate is None:
+                raise ValueError('timestamps or rate is required')
+        else:
+            timestamps = np.broadcast_to(np.asarray(timestamps, dtype = np.float64), values.shape)
+            span = timestamps[..., -1] - timestamps[..., 0]
+            rate = (n - 1) / span
+            grid = timestamps[..., :1] + np.arange(n) * (span / (n - 1))[..., None]
+            if values.ndim == 1:
+                values = np.interp(grid, timestamps, values)
+            else:
+                values = np.stack([np.interp(g, t, v) for g, t, v in zip(grid, timestamps, values)])
+        high = values.max(axis = -1)
+        low = values.min(axis = -1)
+        mean = values.mean(axis = -1)
+        total = values.sum(axis = -1)
+        above = np.clip(values - mean[..., None], 0, None).sum(axis = -1)
+        with np.errstate(invalid = 'ignore', divide = 'ignore'):
+            percent = np.where(high + low > 0, 100.0 * (high - low) / (high + low), 0.0)
+            index = np.where(total > 0, above / total, 0.0)
+        spectrum = np.abs(np.fft.rfft((values - mean[..., None]) * np.hanning(n), axis = -1))
+        spectrum[..., 0] = 0
+        peak = spectrum.argmax(axis = -1)
+        # parabolic interpolation between the neighbouring bins
+        left = np.take_along_axis(spectrum, np.clip(peak - 1, 0, None)[..., None], -1)[..., 0]
+        centre = np.take_along_axis(spectrum, peak[..., None], -1)[..., 0]
+        right = np.take_along_axis(spectrum, np.clip(peak + 1, None, spectrum.shape[-1] - 1)[..., None], -1)[..., 0]
+        denominator = left - 2 * centre + right
+        with np.errstate(invalid = 'ignore', divide = 'ignore'):
+            shift = np.where(denominator != 0, 0.5 * (left - right) / denominator, 0.0)
+        frequency = np.where(centre > 0, (peak + shift) * np.asarray(rate) / n, 0.0)
+        result = {'percent_flicker': percent, 'flicker_index': index, 'dominant_frequency': frequency,
+                  'sample_rate': np.asarray(rate, dtype = np.float64), 'mean': mean}
+        if values.ndim == 1:
+            result = dict((key, float(value)) for key, value in result.items())
+        return result
@@ -0,0 +1,141 @@
+#-*- coding: utf-8 -*-
+""" file DFRobot_TSL2541_InterruptReader.py
+  # DFRobot_TSL2541_InterruptReader Class infrastructure, interrupt driven acquisition for DFRobot_TSL2541
+  @copyright   Copyright (c) 2010 DFRobot Co.Ltd (http://www.dfrobot.com)
+  @licence     The MIT License (MIT)
+  @author      [DFRobot]<https://www.dfrobot.com>
+  @version  V1.0
+  @date  2026-10-18
+  @get from https://www.dfrobot.com
+  @url https://github.com/DFRobot/DFRobot_TSL2541
+"""
+import threading
+import queue
+import time
+
+class DFRobot_TSL2541_InterruptReader:
+    # seconds between attempts to read a sample whose read failed
+    RETRY_INTERVAL                     = 0.1
+
+    '''
+        @brief  Module init
+        @n      The reader keeps the ALS thresholds armed in a window around the last visible value,
+        @n      so the bus stays idle until the light leaves the window and the chip pulls INT low.
+        @n      The reader thread re-arms the thresholds in a transaction while the caller may keep using the
+        @n      sensor; the driver's lock serializes the two.
+        @param  sensor       an initialized DFRobot_TSL2541
+        @param  int_pin      BCM number of the GPIO wired to INT
+        @param  window       half width of the threshold window, as a fraction of the last value
+        @param  margin       minimum half width of the window in counts, keeps it open in the dark
+        @param  persistence  APERS value, consecutive out-of-window results before INT asserts
+        @param  saturation   also interrupt on ALS saturation
+        @param  maxsize      number of samples buffered for get(), 0 for unbounded
+    '''
+    def __init__(self, sensor, int_pin, window = 0.1, margin = 16, persistence = 0x01, saturation = False, maxsize = 0):
+        self.sensor = sensor
+        self._int_pin = int_pin
+        self._window = window
+        self._margin = margin
+        self._persistence = persistence
+        self._saturation = saturation
+        self._edges = queue.Queue()
+        self._samples = queue.Queue(maxsize)
+        self._thread = None
+        self.errors = 0
+
+    '''
+        @brief  Arm the thresholds around the current value and start listening to the INT pin
+        @n      The thresholds are written before the interrupt is enabled, and STATUS is cleared once the
+        @n      edge detection is attached, so a flag latched before start() cannot hold INT low unseen.
+        @return  the first (timestamp, status, vis, ir) sample
+    '''
+    def start(self):
+        import RPi.GPIO as GPIO
+        sample = self._acquire(time.time())
+        with self.sensor.transaction():
+            self.sensor.set_interrupt_persistence(self._persistence)
+            self.sensor.set_als_interrupt(True)
+            self.sensor.set_als_saturation_interrupt(self._saturation)
+        if GPIO.getmode() is None:
+            GPIO.setmode(GPIO.BCM)
+        GPIO.setup(self._int_pin, GPIO.IN)
+        GPIO.add_event_detect(self._int_pin, GPIO.FALLING, callback = self._on_int_edge)
+        self.sensor.clear_status_flags(self.sensor.STATUS_AINT | self.sensor.STATUS_ASAT)
+        self._thread = threading.Thread(target = self._run, name = 'tsl2541-int%d' % self._int_pin)
+        self._thread.daemon = True
+        self._thread.start()
+        return sample
+
+    '''
+        @brief  Stop listening and disable the ALS interrupt
+    '''
+    def stop(self):
+        if self._thread is None:
+            return
+        import RPi.GPIO as GPIO
+        GPIO.remove_event_detect(self._int_pin)
+        self._edges.put(None)
+        self._thread.join()
+        self._thread = None
+        with self.sensor.transaction():
+            self.sensor.set_als_interrupt(False)
+            self.sensor.set_als_saturation_interrupt(False)
+
+    '''
+        @brief  Get the next sample taken on an interrupt
+        @param  timeout  seconds to wait, None to wait forever
+        @return  (timestamp, status, vis, ir), None on timeout
+    '''
+    def get(self, timeout = None):
+        try:
+            return self._samples.get(timeout = timeout)
+        except queue.Empty:
+            return None
+
+    def __iter__(self):
+        while True:
+            yield self._samples.get()
+
+    '''
+        @brief  Compute the threshold window around a visible value
+        @param  vis  the visible value the window is centred on
+        @return  (ailt, aiht)
+    '''
+    def threshold_window(self, vis):
+        half = max(int(vis * self._window), self._margin)
+        return (max(vis - half, 0), min(vis + half, 0xFFFF))
+
+    def _acquire(self, timestamp):
+        status, vis, ir = self.sensor.read_status_channels()
+        low, high = self.threshold_window(vis)
+        self.sensor.set_interrupt_threshold(low, high)
+        return (timestamp, status, vis, ir)
+
+    def _on_int_edge(self, channel):
+        self._edges.put(time.time())
+
+    def _run(self):
+        failed = None
+        while True:
+            try:
+                timestamp = self._edges.get(timeout = None if failed is None else self.RETRY_INTERVAL)
+            except queue.Empty:
+                # INT stays asserted until STATUS is read, so no new edge comes after a failed read
+                timestamp = failed
+            if timestamp is None:
+                return
+            try:
+                sample = self._acquire(timestamp)
+            except IOError:
+                self.errors += 1
+                failed = timestamp
+                continue
+            failed = None
+            try:
+                self._samples.put_nowait(sample)
+            except queue.Full:
+                try:
+                    self._samples.get_nowait()
+                except queue.Empty:
+                    pass
+                self._samples.put_nowait(sample)
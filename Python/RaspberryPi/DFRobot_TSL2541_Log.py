@@ -0,0 +1,224 @@
+#-*- coding: utf-8 -*-
+""" file DFRobot_TSL2541_Log.py
+  # DFRobot_TSL2541_LogWriter/LogReader Class infrastructure, fixed-record binary sample log with a time index
+  @copyright   Copyright (c) 2010 DFRobot Co.Ltd (http://www.dfrobot.com)
+  @licence     The MIT License (MIT)
+  @author      [DFRobot]<https://www.dfrobot.com>
+  @version  V1.0
+  @date  2026-10-18
+  @get from https://www.dfrobot.com
+  @url https://github.com/DFRobot/DFRobot_TSL2541
+"""
+import os
+import struct
+import time
+import numpy as np
+
+# Log file: a 16 byte header followed by fixed-size little-endian records
+LOG_MAGIC                              = b'TSL2541L'
+LOG_VERSION                            = 1
+LOG_HEADER                             = struct.Struct('<8sHHI')   # magic, version, record size, index interval
+LOG_DTYPE = np.dtype([
+    ('timestamp', '<f8'),
+    ('sensor',    '<u2'),
+    ('vis',       '<u2'),
+    ('ir',        '<u2'),
+    ('gain',      'u1'),
+    ('atime',     'u1'),
+    ('status',    'u1'),
+    ('reserved',  'u1'),
+])
+# Index file next to each log: the timestamp and number of every index_interval-th record
+INDEX_DTYPE = np.dtype([
+    ('timestamp', '<f8'),
+    ('record',    '<u8'),
+])
+
+'''
+    @brief  Path of the index file of a log file
+'''
+def index_path(path):
+    return path + '.idx'
+
+class DFRobot_TSL2541_LogWriter:
+    '''
+        @brief  Module init
+        @n      Samples of any number of sensors are appended, in time order, to one file per `rotate` seconds
+        @n      named <prefix>-<start time>.log. Records are collected in a preallocated block and written
+        @n      when it is full or on flush(), so the SD card sees few large writes.
+        @param  directory       where the files are written
+        @param  prefix          file name prefix
+        @param  rotate          seconds covered by one file, None for a single file
+        @param  index_interval  records between two index entries
+        @param  block           records written per flush
+    '''
+    def __init__(self, directory, prefix = 'tsl2541', rotate = 86400, index_interval = 1024, block = 256):
+        self.directory = directory
+        self.prefix = prefix
+        self.rotate = rotate
+        self.index_interval = index_interval
+        self._block = np.zeros(block, dtype = LOG_DTYPE)
+        self._pending = 0
+        self._file = None
+        self._index = None
+        self._records = 0
+        self._file_end = None
+        self.path = None
+
+    '''
+        @brief  Append one sample
+        @param  timestamp  seconds since the epoch
+        @param  sensor     sensor id (0 - 65535)
+    '''
+    def append(self, timestamp, sensor, vis, ir, gain = 0, atime = 0, status = 0):
+        if self._file is None or (self._file_end is not None and timestamp >= self._file_end):
+            self._open(timestamp)
+        if self._records % self.index_interval == 0:
+            self.flush()
+            self._index.write(np.array([(timestamp, self._records)], dtype = INDEX_DTYPE).tobytes())
+        self._block[self._pending] = (timestamp, sensor, vis, ir, gain, atime, status, 0)
+        self._pending += 1
+        self._records += 1
+        if self._pending == len(self._block):
+            self.flush()
+
+    '''
+        @brief  Take one burst reading of STATUS and both channels from a sensor and append it
+        @param  sensor     a DFRobot_TSL2541
+        @param  sensor_id  id stored with the sample
+    '''
+    def record(self, sensor, sensor_id = 0):
+        status, vis, ir = sensor.read_status_channels()
+        self.append(time.time(), sensor_id, vis, ir, sensor.get_als_gain(), sensor.get_integration_time(), status)
+
+    '''
+        @brief  Write the collected records
+    '''
+    def flush(self):
+        if self._file is None:
+            return
+        if self._pending:
+            self._file.write(self._block[:self._pending].tobytes())
+            self._pending = 0
+        self._file.flush()
+        self._index.flush()
+
+    def close(self):
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._index.close()
+        self._file = None
+        self._index = None
+
+    def _open(self, timestamp):
+        self.close()
+        start = int(timestamp)
+        if self.rotate is not None:
+            start = start - start % int(self.rotate)
+            self._file_end = start + self.rotate
+        self.path = os.path.join(self.directory, '%s-%010d.log' % (self.prefix, start))
+        exists = os.path.exists(self.path) and os.path.getsize(self.path) >= LOG_HEADER.size
+        self._file = open(self.path, 'ab')
+        self._index = open(index_path(self.path), 'ab')
+        if exists:
+            # drop a record torn by a crash, then continue the numbering
+            size = os.path.getsize(self.path) - LOG_HEADER.size
+            self._records = size // LOG_DTYPE.itemsize
+            self._file.truncate(LOG_HEADER.size + self._records * LOG_DTYPE.itemsize)
+        else:
+            self._file.truncate(0)
+            self._file.write(LOG_HEADER.pack(LOG_MAGIC, LOG_VERSION, LOG_DTYPE.itemsize, self.index_interval))
+            self._index.truncate(0)
+            self._records = 0
+
+class DFRobot_TSL2541_LogReader:
+    '''
+        @brief  Module init
+        @n      Files are memory-mapped, queries locate the records through the time index and return
+        @n      NumPy structured arrays; a query inside one file without a sensor filter is a zero-copy view.
+        @param  directory  where the files are
+        @param  prefix     file name prefix
+    '''
+    def __init__(self, directory, prefix = 'tsl2541'):
+        self.directory = directory
+        self.prefix = prefix
+        self._maps = {}
+
+    '''
+        @brief  Log files, oldest first
+        @return  list of (start time, path)
+    '''
+    def files(self):
+        result = []
+        head = self.prefix + '-'
+        for name in os.listdir(self.directory):
+            if name.startswith(head) and name.endswith('.log'):
+                result.append((int(name[len(head):-4]), os.path.join(self.directory, name)))
+        return sorted(result)
+
+    '''
+        @brief  Records of one file, memory-mapped
+        @return  (records, index) structured arrays
+    '''
+    def open(self, path):
+        size = os.path.getsize(path)
+        cached = self._maps.get(path)
+        if cached is not None and cached[0] == size:
+            return cached[1], cached[2]
+        with open(path, 'rb') as f:
+            magic, version, record_size, interval = LOG_HEADER.unpack(f.read(LOG_HEADER.size))
+        if magic != LOG_MAGIC or version != LOG_VERSION or record_size != LOG_DTYPE.itemsize:
+            raise ValueError('%s is not a version %d TSL2541 log' % (path, LOG_VERSION))
+        count = (size - LOG_HEADER.size) // LOG_DTYPE.itemsize
+        records = np.zeros(0, dtype = LOG_DTYPE)
+        if count:
+            records = np.memmap(path, dtype = LOG_DTYPE, mode = 'r', offset = LOG_HEADER.size, shape = (count,))
+        index = np.zeros(0, dtype = INDEX_DTYPE)
+        ipath = index_path(path)
+        if os.path.exists(ipath) and os.path.getsize(ipath) >= INDEX_DTYPE.itemsize:
+            index = np.memmap(ipath, dtype = INDEX_DTYPE, mode = 'r', shape = (os.path.getsize(ipath) // INDEX_DTYPE.itemsize,))
+        self._maps[path] = (size, records, index)
+        return records, index
+
+    '''
+        @brief  Records with start <= timestamp < end
+        @param  sensor  only this sensor id, None for all
+        @return  structured array with the fields of LOG_DTYPE, oldest first
+    '''
+    def query(self, start, end, sensor = None):
+        parts = []
+        starts = self.files()
+        for i in range(len(starts)):
+            if starts[i][0] >= end or (i + 1 < len(starts) and starts[i + 1][0] <= start):
+                continue
+            records, index = self.open(starts[i][1])
+            part = self._range(records, index, start, end)
+            if sensor is not None:
+                part = part[part['sensor'] == sensor]
+            if len(part):
+                parts.append(part)
+        if not parts:
+            return np.zeros(0, dtype = LOG_DTYPE)
+        if len(parts) == 1:
+            return parts[0]
+        return np.concatenate(parts)
+
+    def close(self):
+        self._maps = {}
+
+    def _range(self, records, index, start, end):
+        # narrow to the indexed block, then binary search inside it
+        low = 0
+        high = len(records)
+        if len(index):
+            times = index['timestamp']
+            # last entry strictly before start, records sharing a timestamp may precede an equal entry
+            i = np.searchsorted(times, start, 'left') - 1
+            if i >= 0:
+                low = int(index['record'][i])
+            j = np.searchsorted(times, end, 'left')
+            if j < len(index):
+                high = min(int(index['record'][j]), high)
+        times = records['timestamp'][low:high]
+        return records[low + np.searchsorted(times, start, 'left'):low + np.searchsorted(times, end, 'left')]
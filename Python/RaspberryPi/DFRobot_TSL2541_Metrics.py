@@ -0,0 +1,177 @@
+#-*- coding: utf-8 -*-
+""" file DFRobot_TSL2541_Metrics.py
+  # DFRobot_TSL2541_Metrics Class infrastructure, bus health metrics of one DFRobot_TSL2541
+  @copyright   Copyright (c) 2010 DFRobot Co.Ltd (http://www.dfrobot.com)
+  @licence     The MIT License (MIT)
+  @author      [DFRobot]<https://www.dfrobot.com>
+  @version  V1.0
+  @date  2026-10-18
+  @get from https://www.dfrobot.com
+  @url https://github.com/DFRobot/DFRobot_TSL2541
+"""
+import collections
+import threading
+import time
+
+class DFRobot_TSL2541_Metrics:
+    # Upper bounds of the latency histogram buckets, in seconds
+    LATENCY_BUCKETS                    = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+
+    '''
+        @brief  Module init
+        @n      Attach it with sensor.set_metrics(metrics). A sensor without metrics pays one None check per transfer.
+        @param  sensor_label    value of the 'sensor' label in the exported metrics
+        @param  slow_threshold  transfers slower than this many seconds are reported as slow events
+        @param  on_slow         optional callable(event) run for each slow transfer, event is a dict
+        @param  slow_history    number of slow events kept for slow_events()
+    '''
+    def __init__(self, sensor_label = 'tsl2541', slow_threshold = 0.01, on_slow = None, slow_history = 32):
+        self.sensor_label = sensor_label
+        self.slow_threshold = slow_threshold
+        self.on_slow = on_slow
+        self._lock = threading.Lock()
+        self._slow = collections.deque(maxlen = slow_history)
+        self.reset()
+
+    '''
+        @brief  Zero every counter and histogram
+    '''
+    def reset(self):
+        with self._lock:
+            self._transfers = {}
+            self._bytes = {}
+            self._errors = {}
+            self._retries = {}
+            self._slow_count = 0
+            self._buckets = {}
+            self._latency_sum = {}
+            self._latency_count = {}
+            self._slow.clear()
+
+    '''
+        @brief  Run one bus transfer and record it
+        @param  op      'read', 'write', 'read_block', 'write_block' or 'quick'
+        @param  reg     first register of the transfer
+        @param  length  number of data bytes
+        @param  func    the SMBus method to call
+        @return  the result of func
+    '''
+    def call(self, op, reg, length, func, *args):
+        start = time.perf_counter()
+        try:
+            result = func(*args)
+        except Exception as e:
+            self.record(op, reg, length, time.perf_counter() - start, e)
+            raise
+        self.record(op, reg, length, time.perf_counter() - start)
+        return result
+
+    '''
+        @brief  Record a finished transfer
+        @param  op       transfer type
+        @param  reg      first register of the transfer
+        @param  length   number of data bytes
+        @param  latency  duration in seconds
+        @param  error    the exception raised by the transfer, None on success
+    '''
+    def record(self, op, reg, length, latency, error = None):
+        key = (op, reg)
+        event = None
+        with self._lock:
+            self._transfers[key] = self._transfers.get(key, 0) + 1
+            if error is not None:
+                self._errors[key] = self._errors.get(key, 0) + 1
+            else:
+                self._bytes[op] = self._bytes.get(op, 0) + length
+            buckets = self._buckets.get(op)
+            if buckets is None:
+                buckets = self._buckets[op] = [0] * len(self.LATENCY_BUCKETS)
+            for i in range(len(self.LATENCY_BUCKETS)):
+                if latency <= self.LATENCY_BUCKETS[i]:
+                    buckets[i] += 1
+                    break
+            self._latency_sum[op] = self._latency_sum.get(op, 0.0) + latency
+            self._latency_count[op] = self._latency_count.get(op, 0) + 1
+            if latency >= self.slow_threshold:
+                self._slow_count += 1
+                event = {'time': time.time(), 'op': op, 'reg': reg, 'latency': latency,
+                         'error': None if error is None else repr(error)}
+                self._slow.append(event)
+        if event is not None and self.on_slow is not None:
+            self.on_slow(event)
+
+    '''
+        @brief  Count a retried transfer
+        @param  op   transfer type
+        @param  reg  first register of the transfer
+    '''
+    def record_retry(self, op, reg):
+        key = (op, reg)
+        with self._lock:
+            self._retries[key] = self._retries.get(key, 0) + 1
+
+    '''
+        @brief  Get the most recent slow transfers
+        @return  list of dicts with time, op, reg, latency and error
+    '''
+    def slow_events(self):
+        with self._lock:
+            return list(self._slow)
+
+    '''
+        @brief  Get a copy of every counter
+        @return  dict with transfers, errors and retries keyed by (op, reg), bytes by op, latency histograms by op
+    '''
+    def snapshot(self):
+        with self._lock:
+            latency = {}
+            for op in self._buckets:
+                latency[op] = {'buckets': list(zip(self.LATENCY_BUCKETS, self._buckets[op])),
+                               'sum': self._latency_sum[op], 'count': self._latency_count[op]}
+            return {'sensor': self.sensor_label, 'transfers': dict(self._transfers), 'errors': dict(self._errors),
+                    'retries': dict(self._retries), 'bytes': dict(self._bytes), 'slow': self._slow_count,
+                    'latency': latency}
+
+    '''
+        @brief  Pass a snapshot to a collector
+        @param  callback  callable(snapshot)
+    '''
+    def export(self, callback):
+        callback(self.snapshot())
+
+    '''
+        @brief  Render the counters in the Prometheus text exposition format
+        @return  the metrics text
+    '''
+    def prometheus(self):
+        snap = self.snapshot()
+        sensor = snap['sensor']
+        lines = []
+        self._counter(lines, 'tsl2541_bus_transfers_total', 'Bus transfers by type and register', sensor, snap['transfers'])
+        self._counter(lines, 'tsl2541_bus_errors_total', 'Failed bus transfers by type and register', sensor, snap['errors'])
+        self._counter(lines, 'tsl2541_bus_retries_total', 'Retried bus transfers by type and register', sensor, snap['retries'])
+        lines.append('# HELP tsl2541_bus_bytes_total Data bytes moved by transfer type')
+        lines.append('# TYPE tsl2541_bus_bytes_total counter')
+        for op in sorted(snap['bytes']):
+            lines.append('tsl2541_bus_bytes_total{sensor="%s",op="%s"} %d' % (sensor, op, snap['bytes'][op]))
+        lines.append('# HELP tsl2541_bus_slow_transfers_total Transfers slower than the slow threshold')
+        lines.append('# TYPE tsl2541_bus_slow_transfers_total counter')
+        lines.append('tsl2541_bus_slow_transfers_total{sensor="%s"} %d' % (sensor, snap['slow']))
+        lines.append('# HELP tsl2541_bus_latency_seconds Bus transfer latency')
+        lines.append('# TYPE tsl2541_bus_latency_seconds histogram')
+        for op in sorted(snap['latency']):
+            histogram = snap['latency'][op]
+            total = 0
+            for bound, count in histogram['buckets']:
+                total += count
+                lines.append('tsl2541_bus_latency_seconds_bucket{sensor="%s",op="%s",le="%g"} %d' % (sensor, op, bound, total))
+            lines.append('tsl2541_bus_latency_seconds_bucket{sensor="%s",op="%s",le="+Inf"} %d' % (sensor, op, histogram['count']))
+            lines.append('tsl2541_bus_latency_seconds_sum{sensor="%s",op="%s"} %.9f' % (sensor, op, histogram['sum']))
+            lines.append('tsl2541_bus_latency_seconds_count{sensor="%s",op="%s"} %d' % (sensor, op, histogram['count']))
+        return '\n'.join(lines) + '\n'
+
+    def _counter(self, lines, name, help_text, sensor, values):
+        lines.append('# HELP %s %s' % (name, help_text))
+        lines.append('# TYPE %s counter' % name)
+        for op, reg in sorted(values):
+            lines.append('%s{sensor="%s",op="%s",reg="0x%02X"} %d' % (name, sensor, op, reg, values[(op, reg)]))
@@ -0,0 +1,104 @@
+#-*- coding: utf-8 -*-
+""" file DFRobot_TSL2541_PowerScheduler.py
+  # DFRobot_TSL2541_PowerScheduler Class infrastructure, lowest duty cycle ATIME/WTIME/WLONG settings for a sample rate
+  @copyright   Copyright (c) 2010 DFRobot Co.Ltd (http://www.dfrobot.com)
+  @licence     The MIT License (MIT)
+  @author      [DFRobot]<https://www.dfrobot.com>
+  @version  V1.0
+  @date  2026-10-18
+  @get from https://www.dfrobot.com
+  @url https://github.com/DFRobot/DFRobot_TSL2541
+"""
+from DFRobot_TSL2541 import DFRobot_TSL2541
+
+class DFRobot_TSL2541_PowerScheduler:
+    # Typical supply currents in amperes, pass the values of your part to __init__ for better estimates
+    ACTIVE_CURRENT                     = 0.000090
+    WAIT_CURRENT                       = 0.000030
+    SLEEP_CURRENT                      = 0.0000007
+    WLONG_FACTOR                       = 12
+
+    '''
+        @brief  Module init
+        @n      The ADC integrates for (ATIME+1) steps, then the wait timer idles for (WTIME+1) steps,
+        @n      12 times longer with WLONG. The scheduler keeps the integration as short as allowed and
+        @n      fills the rest of the requested period with wait time, which draws less current.
+        @param  sensor          an initialized DFRobot_TSL2541
+        @param  min_atime       shortest ATIME that still gives the resolution you need
+        @param  active_current  supply current while integrating, in amperes
+        @param  wait_current    supply current in the wait state, in amperes
+        @param  sleep_current   supply current while asleep after an interrupt, in amperes
+    '''
+    def __init__(self, sensor, min_atime = 0x23, active_current = None, wait_current = None, sleep_current = None):
+        self.sensor = sensor
+        self.min_atime = min_atime
+        self.active_current = self.ACTIVE_CURRENT if active_current is None else active_current
+        self.wait_current = self.WAIT_CURRENT if wait_current is None else wait_current
+        self.sleep_current = self.SLEEP_CURRENT if sleep_current is None else sleep_current
+        self.plan = None
+
+    '''
+        @brief  Compute the settings for a sample rate without touching the sensor
+        @param  rate                  samples per second the consumer needs
+        @param  latency               longest acceptable delay in seconds between a light change and a result, None for 1/rate
+        @param  sleep_after_interrupt stop the ADC after an interrupt until the host clears it
+        @return  dict with atime, wtime, wlong, wait_timer, sleep_after_interrupt, period (achieved, seconds),
+        @n       duty (fraction of the period spent integrating) and current (estimated average, amperes)
+    '''
+    def compute(self, rate, latency = None, sleep_after_interrupt = False):
+        step = DFRobot_TSL2541.CYCLE_STEP
+        target = 1.0 / rate
+        if latency is not None:
+            target = min(target, latency)
+        steps = int(target / step + 1e-9)
+        if steps < 1:
+            raise ValueError('rate above the fastest ALS cycle of %.2f ms' % (step * 1000))
+        atime = min(self.min_atime, steps - 1, 0xFF)
+        plan = {'atime': atime, 'wtime': 0, 'wlong': False, 'wait_timer': False,
+                'sleep_after_interrupt': sleep_after_interrupt}
+        wait_steps = steps - (atime + 1)
+        if wait_steps >= 1:
+            plan['wait_timer'] = True
+            # just past 256 steps WLONG can give less wait than WTIME 0xFF alone, keep the longer one
+            short_wait = min(wait_steps, 0x100)
+            long_wait = min(wait_steps // self.WLONG_FACTOR, 0x100) * self.WLONG_FACTOR
+            if long_wait > short_wait:
+                plan['wlong'] = True
+                plan['wtime'] = long_wait // self.WLONG_FACTOR - 1
+            else:
+                plan['wtime'] = short_wait - 1
+        integration = (atime + 1) * step
+        wait = 0.0
+        if plan['wait_timer']:
+            wait = (plan['wtime'] + 1) * step * (self.WLONG_FACTOR if plan['wlong'] else 1)
+        plan['period'] = integration + wait
+        plan['duty'] = integration / plan['period']
+        plan['current'] = (self.active_current * integration + self.wait_current * wait) / plan['period']
+        return plan
+
+    '''
+        @brief  Program the sensor for a sample rate, writing nothing if the settings did not change
+        @param  rate                  samples per second
+        @param  latency               longest acceptable delay between a light change and a result, in seconds
+        @param  sleep_after_interrupt stop the ADC after an interrupt until the host clears it
+        @return  the applied plan, see compute()
+    '''
+    def set_rate(self, rate, latency = None, sleep_after_interrupt = False):
+        plan = self.compute(rate, latency, sleep_after_interrupt)
+        if self.plan is None or any(self.plan[key] != plan[key] for key in
+                                    ('atime', 'wtime', 'wlong', 'wait_timer', 'sleep_after_interrupt')):
+            self.sensor.configure(integration_time = plan['atime'], wait_time = plan['wtime'],
+                                  wait_long_time = plan['wlong'], wait_timer = plan['wait_timer'],
+                                  sleep_after_interrupt = plan['sleep_after_interrupt'])
+        self.plan = plan
+        return plan
+
+    '''
+        @brief  Estimated average current when the sensor sleeps after an interrupt for part of the time
+        @param  asleep  fraction of the time spent asleep waiting for the host
+        @return  amperes
+    '''
+    def estimated_current(self, asleep = 0.0):
+        if self.plan is None:
+            return None
+        return self.plan['current'] * (1 - asleep) + self.sleep_current * asleep
@@ -0,0 +1,85 @@
+#-*- coding: utf-8 -*-
+""" file DFRobot_TSL2541_Profiles.py
+  # DFRobot_TSL2541_Profiles Class infrastructure, named configurations compiled once into register images
+  @copyright   Copyright (c) 2010 DFRobot Co.Ltd (http://www.dfrobot.com)
+  @licence     The MIT License (MIT)
+  @author      [DFRobot]<https://www.dfrobot.com>
+  @version  V1.0
+  @date  2026-10-18
+  @get from https://www.dfrobot.com
+  @url https://github.com/DFRobot/DFRobot_TSL2541
+"""
+from DFRobot_TSL2541 import DFRobot_TSL2541
+from DFRobot_TSL2541_Emulator import DFRobot_TSL2541_Emulator
+
+class DFRobot_TSL2541_Profiles:
+    # name -> configure() fields, applied on top of the state left by begin()
+    DEFAULT_PROFILES = {
+        'indoor':          {'integration_time': 0x23, 'als_gain': 4, 'wait_timer': False},
+        'indoor-fast':     {'integration_time': 0x08, 'als_gain': 5, 'wait_timer': False},
+        'outdoor-lowgain': {'integration_time': 0x23, 'als_gain': 0, 'wait_timer': False},
+        'low-power':       {'integration_time': 0x11, 'als_gain': 4, 'wait_timer': True,
+                            'wait_time': 0x3F, 'wait_long_time': True},
+    }
+
+    '''
+        @brief  Module init
+        @n      A profile is a set of configure() fields. It is compiled once, by running the setters against
+        @n      a DFRobot_TSL2541_Emulator, into an image of the registers those setters write, so applying
+        @n      it is a few block writes and block reads whatever the number of settings. Registers the
+        @n      profile does not name, e.g. the thresholds, PERS and INTENAB, are left as they are.
+        @param  profiles  dict of name -> configure() fields, DEFAULT_PROFILES if None
+    '''
+    def __init__(self, profiles = None):
+        self._fields = {}
+        self._images = {}
+        for name, fields in (self.DEFAULT_PROFILES if profiles is None else profiles).items():
+            self.define(name, **fields)
+
+    '''
+        @brief  Add or replace a profile
+        @param  name    profile name
+        @param  fields  configure() keywords, e.g. integration_time=0x23, als_gain=4
+    '''
+    def define(self, name, **fields):
+        self._fields[name] = dict(fields)
+        self._images[name] = self.compile(fields)
+
+    '''
+        @brief  Names of the defined profiles
+    '''
+    def names(self):
+        return sorted(self._fields)
+
+    '''
+        @brief  Register image of a profile
+        @return  dict of register -> value
+    '''
+    def image(self, name):
+        return dict(self._images[name])
+
+    '''
+        @brief  Apply a profile
+        @param  sensor  an initialized DFRobot_TSL2541
+        @param  name    profile name
+        @param  verify  read the written registers back
+        @return  number of registers written
+    '''
+    def apply(self, sensor, name, verify = True):
+        return sensor.write_config_image(self._images[name], verify)
+
+    '''
+        @brief  Compile configure() fields into a register image
+        @n      A register stays in the image when a setter writes it, even with its begin() value, so that
+        @n      e.g. wait_timer=False turns the wait timer off after a profile that turned it on.
+        @return  dict of register -> value for the registers written by the setters of the fields
+    '''
+    @staticmethod
+    def compile(fields):
+        sensor = DFRobot_TSL2541(DFRobot_TSL2541_Emulator())
+        sensor.begin()
+        with sensor.transaction():
+            sensor.configure(**fields)
+            written = set(sensor._batch)
+        image = sensor.config_image()
+        return dict((reg, image[reg]) for reg in written if reg in image)
@@ -0,0 +1,148 @@
+#-*- coding: utf-8 -*-
+""" file DFRobot_TSL2541_RingBuffer.py
+  # DFRobot_TSL2541_RingBuffer Class infrastructure, fixed-capacity sample store backed by a NumPy structured array
+  @copyright   Copyright (c) 2010 DFRobot Co.Ltd (http://www.dfrobot.com)
+  @licence     The MIT License (MIT)
+  @author      [DFRobot]<https://www.dfrobot.com>
+  @version  V1.0
+  @date  2026-10-18
+  @get from https://www.dfrobot.com
+  @url https://github.com/DFRobot/DFRobot_TSL2541
+"""
+import time
+import numpy as np
+
+# One record per sample
+SAMPLE_DTYPE = np.dtype([
+    ('timestamp', '<f8'),
+    ('vis',       '<u2'),
+    ('ir',        '<u2'),
+    ('gain',      'u1'),
+    ('atime',     'u1'),
+    ('status',    'u1'),
+])
+
+class DFRobot_TSL2541_RingBuffer:
+    '''
+        @brief  Module init
+        @n      Storage is allocated once; append() writes into preallocated columns and never allocates.
+        @n      There is one writer; readers get views that the writer overwrites once the buffer wraps.
+        @param  capacity  number of samples kept
+        @param  buffer    optional writable buffer (e.g. shared memory) holding the samples, allocated if None
+    '''
+    def __init__(self, capacity, buffer = None):
+        self.capacity = capacity
+        if buffer is None:
+            self.data = np.zeros(capacity, dtype = SAMPLE_DTYPE)
+        else:
+            self.data = np.ndarray(capacity, dtype = SAMPLE_DTYPE, buffer = buffer)
+        self._timestamp = self.data['timestamp']
+        self._vis = self.data['vis']
+        self._ir = self.data['ir']
+        self._gain = self.data['gain']
+        self._atime = self.data['atime']
+        self._status = self.data['status']
+        self._next = 0
+        self.total = 0
+
+    def __len__(self):
+        return min(self.total, self.capacity)
+
+    '''
+        @brief  Store one sample, overwriting the oldest when full
+    '''
+    def append(self, timestamp, vis, ir, gain = 0, atime = 0, status = 0):
+        i = self._next
+        self._timestamp[i] = timestamp
+        self._vis[i] = vis
+        self._ir[i] = ir
+        self._gain[i] = gain
+        self._atime[i] = atime
+        self._status[i] = status
+        self._next = i + 1 if i + 1 < self.capacity else 0
+        self.total += 1
+
+    '''
+        @brief  Position of the next write and number of samples written so far
+        @return  (index, total)
+    '''
+    def position(self):
+        return (self._next, self.total)
+
+    '''
+        @brief  Adopt the write position of another writer of the same buffer
+    '''
+    def set_position(self, index, total):
+        self._next = index
+        self.total = total
+
+    '''
+        @brief  Take one burst reading of STATUS and both channels from a sensor and store it
+        @param  sensor  a DFRobot_TSL2541
+    '''
+    def record(self, sensor):
+        status, vis, ir = sensor.read_status_channels()
+        self.append(time.time(), vis, ir, sensor.get_als_gain(), sensor.get_integration_time(), status)
+
+    '''
+        @brief  Store samples from a (timestamp, vis, ir) iterator such as sensor.stream()
+        @param  sensor   the DFRobot_TSL2541 the samples come from, for the gain and ATIME columns
+        @param  samples  the iterator
+        @param  count    number of samples to store, None until the iterator ends
+    '''
+    def capture(self, sensor, samples, count = None):
+        n = 0
+        for timestamp, vis, ir in samples:
+            self.append(timestamp, vis, ir, sensor.get_als_gain(), sensor.get_integration_time())
+            n += 1
+            if count is not None and n >= count:
+                break
+
+    '''
+        @brief  Zero-copy views of the stored samples, oldest first
+        @return  (older, newer) views of the structured array, either may be empty
+    '''
+    def views(self):
+        if self.total < self.capacity:
+            return (self.data[:self._next], self.data[:0])
+        return (self.data[self._next:], self.data[:self._next])
+
+    '''
+        @brief  Zero-copy view of the newest samples when they do not wrap, otherwise a copy
+        @param  n  number of samples
+        @return  structured array, oldest first
+    '''
+    def latest(self, n):
+        n = min(n, len(self))
+        if n <= self._next:
+            return self.data[self._next - n:self._next]
+        older, newer = self.views()
+        return np.concatenate((older[len(older) - (n - len(newer)):], newer))
+
+    '''
+        @brief  Copy of every stored sample, oldest first
+    '''
+    def snapshot(self):
+        older, newer = self.views()
+        return np.concatenate((older, newer))
+
+    '''
+        @brief  Copy of the samples with start <= timestamp < end, oldest first
+    '''
+    def window(self, start, end):
+        data = self.snapshot()
+        times = data['timestamp']
+        return data[np.searchsorted(times, start, 'left'):np.searchsorted(times, end, 'left')]
+
+    '''
+        @brief  Write the stored samples, oldest first, to a .npy file
+        @param  path  file name or file object
+        @param  start  optional start of a time window
+        @param  end    optional end of a time window
+    '''
+    def export(self, path, start = None, end = None):
+        if start is None and end is None:
+            data = self.snapshot()
+        else:
+            data = self.window(-np.inf if start is None else start, np.inf if end is None else end)
+        np.save(path, data)
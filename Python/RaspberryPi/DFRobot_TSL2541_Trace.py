@@ -0,0 +1,162 @@
+#-*- coding: utf-8 -*-
+""" file DFRobot_TSL2541_Trace.py
+  # DFRobot_TSL2541_TraceRecorder/Replay Class infrastructure, bus transaction traces and an SMBus-compatible replay
+  @copyright   Copyright (c) 2010 DFRobot Co.Ltd (http://www.dfrobot.com)
+  @licence     The MIT License (MIT)
+  @author      [DFRobot]<https://www.dfrobot.com>
+  @version  V1.0
+  @date  2026-10-18
+  @get from https://www.dfrobot.com
+  @url https://github.com/DFRobot/DFRobot_TSL2541
+"""
+import errno
+import os
+import struct
+import threading
+import time
+
+# Trace file: header, then one record per transfer followed by its data bytes
+TRACE_MAGIC                            = b'TSL2541T'
+TRACE_VERSION                          = 1
+TRACE_HEADER                           = struct.Struct('<8sHd')    # magic, version, start time (epoch seconds)
+TRACE_RECORD                           = struct.Struct('<dBBBB')   # seconds since start, op, reg, errno, data length
+TRACE_OPS                              = ('read', 'write', 'read_block', 'write_block', 'quick')
+
+class DFRobot_TSL2541_TraceRecorder:
+    '''
+        @brief  Module init
+        @n      Attach it with sensor.set_trace(recorder). Every transfer is stored with its time, register,
+        @n      data and error, 13 bytes plus the data bytes per transfer. Several sensors may share one recorder
+        @n      only if they are replayed together in the same order.
+        @param  path  trace file to create
+    '''
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, 'wb')
+        self._start = time.perf_counter()
+        self._file.write(TRACE_HEADER.pack(TRACE_MAGIC, TRACE_VERSION, time.time()))
+        self.count = 0
+
+    '''
+        @brief  Store one transfer, called by the driver
+        @param  op      'read', 'write', 'read_block', 'write_block' or 'quick'
+        @param  reg     first register of the transfer
+        @param  args    arguments passed to the SMBus method
+        @param  result  value returned by the SMBus method
+        @param  error   the IOError raised by the transfer, None on success
+    '''
+    def record(self, op, reg, args, result, error = None):
+        code = TRACE_OPS.index(op)
+        data = b''
+        if error is None:
+            if op == 'read':
+                data = bytes(bytearray([result]))
+            elif op == 'read_block':
+                data = bytes(bytearray(result))
+            elif op == 'write':
+                data = bytes(bytearray([args[2]]))
+            elif op == 'write_block':
+                data = bytes(bytearray(args[2]))
+        number = 0
+        if error is not None:
+            number = min(getattr(error, 'errno', None) or errno.EIO, 0xFF)
+        with self._lock:
+            self._file.write(TRACE_RECORD.pack(time.perf_counter() - self._start, code, reg, number, len(data)))
+            self._file.write(data)
+            self.count += 1
+
+    def flush(self):
+        with self._lock:
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+class DFRobot_TSL2541_Replay:
+    '''
+        @brief  Module init
+        @n      SMBus-compatible bus that answers from a trace: pass it to DFRobot_TSL2541(bus = replay).
+        @n      Reads return the recorded data, writes are consumed, recorded errors are raised again.
+        @n      When the end of the trace is reached every transfer raises EOFError.
+        @param  path    trace file written by DFRobot_TSL2541_TraceRecorder
+        @param  speed   None to replay as fast as possible, 1.0 for real time, 10.0 for ten times faster...
+        @param  addr    I2C address the replayed device answers on
+        @param  strict  raise ValueError when a transfer does not match the next record, otherwise skip
+        @n              records until one matches
+    '''
+    def __init__(self, path, speed = None, addr = 0x39, strict = False):
+        self.addr = addr
+        self.speed = speed
+        self.strict = strict
+        self.skipped = 0
+        self.replayed = 0
+        self._file = open(path, 'rb')
+        magic, version, self.start_time = TRACE_HEADER.unpack(self._file.read(TRACE_HEADER.size))
+        if magic != TRACE_MAGIC or version != TRACE_VERSION:
+            raise ValueError('%s is not a version %d TSL2541 trace' % (path, TRACE_VERSION))
+        self._offset = 0.0
+        self._clock_start = None
+
+    '''
+        @brief  Recording time of the last replayed transfer, in epoch seconds
+    '''
+    def time(self):
+        return self.start_time + self._offset
+
+    def read_byte_data(self, addr, reg):
+        return bytearray(self._next(addr, 'read', reg))[0]
+
+    def write_byte_data(self, addr, reg, value):
+        self._next(addr, 'write', reg)
+
+    def read_i2c_block_data(self, addr, reg, length):
+        return list(bytearray(self._next(addr, 'read_block', reg)))[:length]
+
+    def write_i2c_block_data(self, addr, reg, data):
+        self._next(addr, 'write_block', reg)
+
+    def write_quick(self, addr):
+        self._next(addr, 'quick', 0)
+
+    def close(self):
+        self._file.close()
+
+    def _read_record(self):
+        head = self._file.read(TRACE_RECORD.size)
+        if len(head) < TRACE_RECORD.size:
+            raise EOFError('end of trace')
+        offset, code, reg, number, length = TRACE_RECORD.unpack(head)
+        data = self._file.read(length)
+        if len(data) < length:
+            raise EOFError('end of trace')
+        return offset, TRACE_OPS[code], reg, number, data
+
+    def _next(self, addr, op, reg):
+        if addr != self.addr:
+            raise IOError(errno.EREMOTEIO, os.strerror(errno.EREMOTEIO))
+        while True:
+            offset, rec_op, rec_reg, number, data = self._read_record()
+            if rec_op == op and rec_reg == reg:
+                break
+            if self.strict:
+                raise ValueError('trace has %s 0x%02X where %s 0x%02X was requested' % (rec_op, rec_reg, op, reg))
+            self.skipped += 1
+        self._wait(offset)
+        self._offset = offset
+        self.replayed += 1
+        if number:
+            raise IOError(number, os.strerror(number))
+        return data
+
+    def _wait(self, offset):
+        if self.speed is None:
+            return
+        now = time.perf_counter()
+        if self._clock_start is None:
+            self._clock_start = now - offset / self.speed
+        delay = self._clock_start + offset / self.speed - now
+        if delay > 0:
+            time.sleep(delay)
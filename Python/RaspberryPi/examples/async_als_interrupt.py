@@ -0,0 +1,38 @@
+#-*- coding: utf-8 -*-
+""" file async_als_interrupt.py
+  # @brief Await the ambient light interrupt from an asyncio event loop
+  # @n The experimental phenomena：The serial port prints the optical data every time the light leaves the threshold range
+  # @copyright   Copyright (c) 2010 DFRobot Co.Ltd (http://www.dfrobot.com)
+  # @licence     The MIT License (MIT)
+  # @author      [DFRobot]<https://www.dfrobot.com>
+  # @version  V1.0
+  # @date  2026-10-18
+  # @get from https://www.dfrobot.com
+  # @url https://github.com/DFRobot/DFRobot_TSL2541
+"""
+import sys
+sys.path.append('../')
+from DFRobot_TSL2541_Async import DFRobot_TSL2541_Async
+import asyncio
+
+IO1 = 21#set interrupt pin
+
+async def main():
+    TSL2541 = DFRobot_TSL2541_Async(bus = 1, int_pin = IO1)
+    while await TSL2541.begin() == False:
+        print ('Please check that the IIC device is properly connected')
+    sensor = TSL2541.sensor
+    await TSL2541.run(sensor.configure, integration_time = 0x23, als_gain = 4,
+                      als_interrupt = True, interrupt_persistence = 0x01,
+                      interrupt_threshold = (3000, 10000))
+    await TSL2541.run(sensor.clear_int_flag)
+    try:
+        while True:
+            await TSL2541.wait_for_interrupt()
+            vis, IR = await TSL2541.read_channels()
+            print ('Interrupt is triggered. Visble:%d IR:%d'%(vis, IR))
+    finally:
+        TSL2541.close()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -21,8 +21,7 @@ while(TSL2541.begin() == False ):
 
 def main():
     while True:
-        vis = TSL2541.get_visble_data()
-        IR = TSL2541.get_IR_data()
+        vis, IR = TSL2541.read_channels()
         print ('Visble:%d'%vis,' IR:%d'%IR)
         time.sleep(1)
 
@@ -0,0 +1,36 @@
+#-*- coding: utf-8 -*-
+""" file interrupt_reader.py
+  # @brief Only read the sensor when the light changes, using the ALS interrupt
+  # @n The experimental phenomena：The serial port outputs the optical data each time the light moves by more than 10%
+  # @copyright   Copyright (c) 2010 DFRobot Co.Ltd (http://www.dfrobot.com)
+  # @licence     The MIT License (MIT)
+  # @author      [DFRobot]<https://www.dfrobot.com>
+  # @version  V1.0
+  # @date  2026-10-18
+  # @get from https://www.dfrobot.com
+  # @url https://github.com/DFRobot/DFRobot_TSL2541
+"""
+import sys
+sys.path.append('../')
+from DFRobot_TSL2541 import DFRobot_TSL2541
+from DFRobot_TSL2541_InterruptReader import DFRobot_TSL2541_InterruptReader
+
+IO1 = 21#set interrupt pin
+
+TSL2541 = DFRobot_TSL2541(bus = 1)
+while(TSL2541.begin() == False ):
+    print ('Please check that the IIC device is properly connected')
+
+reader = DFRobot_TSL2541_InterruptReader(TSL2541, IO1, window = 0.1, persistence = 0x02)
+
+def main():
+    timestamp, status, vis, IR = reader.start()
+    print ('Visble:%d IR:%d'%(vis, IR))
+    try:
+        for timestamp, status, vis, IR in reader:
+            print ('%.3f Visble:%d IR:%d'%(timestamp, vis, IR))
+    finally:
+        reader.stop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+#-*- coding: utf-8 -*-
+""" file poll_multiple_sensors.py
+  # @brief Poll several TSL2541 behind a TCA9548 mux and on a second I2C bus
+  # @n The experimental phenomena：The serial port outputs the optical data of every sensor once a second
+  # @copyright   Copyright (c) 2010 DFRobot Co.Ltd (http://www.dfrobot.com)
+  # @licence     The MIT License (MIT)
+  # @author      [DFRobot]<https://www.dfrobot.com>
+  # @version  V1.0
+  # @date  2026-10-18
+  # @get from https://www.dfrobot.com
+  # @url https://github.com/DFRobot/DFRobot_TSL2541
+"""
+import sys
+sys.path.append('../')
+from DFRobot_TSL2541_BusManager import DFRobot_TSL2541_BusManager
+import time
+
+manager = DFRobot_TSL2541_BusManager()
+#Four sensors on channels 0-3 of the mux at 0x70 on bus 1, one sensor wired directly to bus 3
+for channel in range(4):
+    manager.add_sensor('mux%d'%channel, bus = 1, mux_addr = 0x70, channel = channel)
+manager.add_sensor('direct', bus = 3)
+
+for name, ok in sorted(manager.begin().items()):
+    if ok == False:
+        print ('Please check that the IIC device %s is properly connected'%name)
+
+def main():
+    try:
+        while True:
+            for name, data in sorted(manager.poll().items()):
+                if data is None:
+                    print ('%s: no answer'%name)
+                else:
+                    print ('%s Visble:%d IR:%d'%(name, data[0], data[1]))
+            time.sleep(1)
+    finally:
+        manager.close()
+
+if __name__ == "__main__":
+    main()
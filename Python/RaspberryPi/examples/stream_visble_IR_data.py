@@ -0,0 +1,30 @@
+#-*- coding: utf-8 -*-
+""" file stream_visble_IR_data.py
+  # @brief Get every visible and IR result the sensor produces, paced by the ALS cycle
+  # @n The experimental phenomena：The serial port outputs the optical data of each ALS cycle once
+  # @copyright   Copyright (c) 2010 DFRobot Co.Ltd (http://www.dfrobot.com)
+  # @licence     The MIT License (MIT)
+  # @author      [DFRobot]<https://www.dfrobot.com>
+  # @version  V1.0
+  # @date  2026-10-18
+  # @get from https://www.dfrobot.com
+  # @url https://github.com/DFRobot/DFRobot_TSL2541
+"""
+import sys
+sys.path.append('../')
+from DFRobot_TSL2541 import DFRobot_TSL2541
+
+TSL2541 = DFRobot_TSL2541(bus = 1)
+while(TSL2541.begin() == False ):
+    print ('Please check that the IIC device is properly connected')
+
+#About 100ms integration time, see set_als_interrupt.py for the ATIME table
+TSL2541.set_integration_time(atime=0x23)
+
+def main():
+    print ('ALS cycle period: %.1fms'%(TSL2541.cycle_period() * 1000))
+    for timestamp, vis, IR in TSL2541.stream():
+        print ('%.3f Visble:%d IR:%d'%(timestamp, vis, IR))
+
+if __name__ == "__main__":
+    main()